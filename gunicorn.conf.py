@@ -0,0 +1,34 @@
+"""Настройки gunicorn: gunicorn yatube.wsgi (файл подхватывается из
+текущей директории).
+
+Синхронный воркер занят одним клиентом, пока тот медленно отправляет
+запрос или читает ответ, и простаивает на каждом запросе к базе.
+Потоковый воркер (gthread) держит открытые соединения в отдельном
+цикле событий и обслуживает несколько запросов одновременно, поэтому
+на одно ядро приходится больше медленных клиентов. Число воркеров и
+потоков настраивается переменными окружения.
+
+Каждый поток держит свое постоянное соединение (CONN_MAX_AGE) с
+основной базой и с каждой репликой, поэтому workers * threads одного
+сервера не должно превышать DB_CONNECTION_BUDGET. По умолчанию это 40
+из 100 соединений PostgreSQL (max_connections): остальное остается
+фоновым командам, миграциям и второму серверу приложения. При
+нескольких серверах бюджет делится между ними.
+
+Сравнить sync и gthread на своей базе можно командой
+`python manage.py benchmark_servers`.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '127.0.0.1:8000')
+worker_class = 'gthread'
+connection_budget = int(os.environ.get('DB_CONNECTION_BUDGET', 40))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+workers = int(os.environ.get(
+    'GUNICORN_WORKERS',
+    max(1, min(multiprocessing.cpu_count() * 2 + 1,
+               connection_budget // threads))))
+# Медленный клиент не занимает поток, пока соединение простаивает
+keepalive = 5
+timeout = 30
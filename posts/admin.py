@@ -1,12 +1,59 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
+from . import search
 from .models import Comment, Follow, Group, Post
 
+# Ниже этого числа строк точный COUNT(*) дешевле, чем ошибка оценки
+ESTIMATE_THRESHOLD = 10000
+SEARCH_LIMIT = 1000
 
-class PostAdmin(admin.ModelAdmin):
+
+class EstimatedCountPaginator(Paginator):
+    '''Для списка без фильтров берет оценку числа строк из статистики
+    PostgreSQL вместо COUNT(*) по всей таблице'''
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples FROM pg_class WHERE relname = %s',
+                    [queryset.model._meta.db_table])
+                row = cursor.fetchone()
+            if row and row[0] > ESTIMATE_THRESHOLD:
+                return int(row[0])
+        return super().count
+
+
+class ScalableAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class FullTextSearchAdmin(ScalableAdmin):
+    '''Поиск по тексту через полнотекстовый индекс вместо icontains'''
+    search_kind = None
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        ids = search.matching_ids(self.search_kind, search_term,
+                                  SEARCH_LIMIT)
+        return queryset.filter(pk__in=ids), False
+
+
+class PostAdmin(FullTextSearchAdmin):
     list_display = ("pk", "text", "pub_date", "author")
+    list_select_related = ("author",)
     search_fields = ("text",)
+    search_kind = search.POST
     list_filter = ("pub_date",)
+    autocomplete_fields = ("author", "group")
+    readonly_fields = ("comment_count",)
     empty_value_display = '-пусто-'
 
 
@@ -16,16 +63,29 @@ class GroupAdmin(admin.ModelAdmin):
     empty_value_display = '-пусто'
 
 
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(FullTextSearchAdmin):
     list_display = ("pk", "text", "created", "author", "post")
+    list_select_related = ("author", "post")
     search_fields = ("text",)
+    search_kind = search.COMMENT
     list_filter = ("created",)
+    autocomplete_fields = ("author",)
+    raw_id_fields = ("post",)
     empty_value_display = '-пусто'
 
+    def get_readonly_fields(self, request, obj=None):
+        # Счетчик комментариев меняется только при создании и удалении,
+        # поэтому перенести комментарий к другой публикации нельзя
+        if obj is not None:
+            return self.readonly_fields + ("post",)
+        return self.readonly_fields
+
 
-class FollowAdmin(admin.ModelAdmin):
+class FollowAdmin(ScalableAdmin):
     list_display = ("user", "author",)
-    search_fields = ("user__username",)
+    list_select_related = ("user", "author")
+    search_fields = ("=user__username",)
+    autocomplete_fields = ("user", "author")
     empty_value_display = '-пусто'
 
 
@@ -0,0 +1,180 @@
+'''Только читающее JSON API для мобильного клиента.
+
+Записи выбираются через values() и сериализуются как словари, без
+создания моделей и отрисовки шаблонов. Списки публикаций и комментариев
+листаются по курсору (дата, id), как и HTML-ленты. Параметр
+?fields=id,text,author ограничивает набор полей ответа'''
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.http import require_GET
+
+from .models import Comment, Group, Post
+from .paginator import CursorPaginator
+from .timeline import follow_feed
+
+API_PAGE_SIZE = 20
+API_MAX_PAGE_SIZE = 100
+
+# Поле ответа и выражение для values()
+POST_FIELDS = {
+    'id': 'id',
+    'text': 'text',
+    'pub_date': 'pub_date',
+    'author': 'author__username',
+    'group': 'group__slug',
+    'image': 'image',
+    'comment_count': 'comment_count',
+    'updated_at': 'updated_at',
+}
+COMMENT_FIELDS = {
+    'id': 'id',
+    'post': 'post_id',
+    'author': 'author__username',
+    'text': 'text',
+    'created': 'created',
+    'updated_at': 'updated_at',
+}
+GROUP_FIELDS = {
+    'id': 'id',
+    'title': 'title',
+    'slug': 'slug',
+    'description': 'description',
+}
+
+
+class FieldsError(Exception):
+    '''В ?fields= передано неизвестное поле'''
+
+
+def api_response(data, status=200):
+    return JsonResponse(data, status=status, encoder=DjangoJSONEncoder,
+                        json_dumps_params={'ensure_ascii': False})
+
+
+def error_response(message, status=400):
+    return api_response({'error': message}, status=status)
+
+
+def requested_fields(request, available):
+    '''Поля, выбранные клиентом, по умолчанию - все'''
+    fields = request.GET.get('fields')
+    if not fields:
+        return list(available)
+    fields = [name.strip() for name in fields.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in available]
+    if unknown:
+        raise FieldsError('Неизвестные поля: {}'.format(', '.join(unknown)))
+    return fields
+
+
+def page_size(request):
+    try:
+        size = int(request.GET.get('limit', API_PAGE_SIZE))
+    except ValueError:
+        return API_PAGE_SIZE
+    return max(1, min(size, API_MAX_PAGE_SIZE))
+
+
+def serialize(rows, fields, available):
+    '''Переименовывает значения из values() в поля ответа'''
+    results = []
+    for row in rows:
+        item = {name: row[available[name]] for name in fields}
+        if 'image' in item:
+            item['image'] = (default_storage.url(item['image'])
+                             if item['image'] else None)
+        results.append(item)
+    return results
+
+
+def cursor_list(request, queryset, available, key=('pub_date', 'pk'),
+                where=None, date_field='pub_date'):
+    '''Страница записей по курсору в виде ответа API'''
+    try:
+        fields = requested_fields(request, available)
+    except FieldsError as error:
+        return error_response(str(error))
+    # Ключ курсора нужен всегда, даже если клиент его не запросил
+    lookups = set(available[name] for name in fields)
+    lookups.update((date_field, 'id'))
+    paginator = CursorPaginator(queryset.values(*lookups), page_size(request),
+                                key=key, where=where,
+                                row_key=(date_field, 'id'))
+    page = paginator.get_page(after=request.GET.get('after'),
+                              before=request.GET.get('before'))
+    return api_response({
+        'results': serialize(page, fields, available),
+        'next': page.next_cursor,
+        'previous': page.previous_cursor,
+    })
+
+
+@require_GET
+def post_list(request):
+    '''Публикации, новые сверху. Фильтры ?author= и ?group='''
+    where = Q()
+    if request.GET.get('author'):
+        where &= Q(author__username=request.GET['author'])
+    if request.GET.get('group'):
+        where &= Q(group__slug=request.GET['group'])
+    return cursor_list(request, Post.objects.all(), POST_FIELDS, where=where)
+
+
+@require_GET
+def post_detail(request, post_id):
+    try:
+        fields = requested_fields(request, POST_FIELDS)
+    except FieldsError as error:
+        return error_response(str(error))
+    rows = Post.objects.filter(pk=post_id).values(
+        *(POST_FIELDS[name] for name in fields))
+    if not rows:
+        return error_response('Публикация не найдена', status=404)
+    return api_response(serialize(rows, fields, POST_FIELDS)[0])
+
+
+@require_GET
+def comment_list(request, post_id):
+    '''Комментарии к публикации, новые сверху'''
+    get_object_or_404(Post.objects.only('pk'), pk=post_id)
+    return cursor_list(request, Comment.objects.filter(post_id=post_id),
+                       COMMENT_FIELDS, key=('created', 'pk'),
+                       date_field='created')
+
+
+@require_GET
+def group_list(request):
+    '''Группы по возрастанию id, следующая страница - ?after=<id>'''
+    try:
+        fields = requested_fields(request, GROUP_FIELDS)
+    except FieldsError as error:
+        return error_response(str(error))
+    size = page_size(request)
+    groups = Group.objects.order_by('pk')
+    after = request.GET.get('after', '')
+    if after.isdigit():
+        groups = groups.filter(pk__gt=int(after))
+    rows = list(groups.values(
+        *set(GROUP_FIELDS[name] for name in fields) | {'id'})[:size + 1])
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        next_cursor = str(rows[-1]['id'])
+    return api_response({
+        'results': serialize(rows, fields, GROUP_FIELDS),
+        'next': next_cursor,
+    })
+
+
+@require_GET
+def follow_list(request):
+    '''Лента подписок текущего пользователя'''
+    if not request.user.is_authenticated:
+        return error_response('Требуется авторизация', status=401)
+    queryset, options = follow_feed(request.user)
+    response = cursor_list(request, queryset, POST_FIELDS, **options)
+    response['Cache-Control'] = 'private'
+    return response
@@ -1,6 +1,11 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class PostsConfig(AppConfig):
     name = 'posts'
     verbose_name = 'Публикации и группы'
+
+    def ready(self):
+        from . import search, signals  # noqa: F401
+        post_migrate.connect(search.create_index, sender=self)
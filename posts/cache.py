@@ -0,0 +1,117 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import (get_conditional_response, patch_cache_control,
+                                patch_vary_headers)
+from django.utils.http import http_date, quote_etag
+
+GENERATION_KEY = 'feed_generation:{}'
+PAGE_KEY = 'anonymous_page:{}:{}'
+PAGE_CACHE_TIMEOUT = 60 * 10
+
+
+def _now():
+    return int(time.time() * 1000)
+
+
+def feed_scopes(post_id, author_id, group_id):
+    '''Страницы, на которых показывается публикация'''
+    scopes = ['all', 'post:{}'.format(post_id),
+              'author:{}'.format(author_id)]
+    if group_id is not None:
+        scopes.append('group:{}'.format(group_id))
+    return scopes
+
+
+def get_generations(scopes):
+    '''Текущие поколения страниц: all, post:<id>, author:<id> или
+    group:<id>. Поколение - время последнего изменения в миллисекундах,
+    поэтому после вытеснения из кеша оно не совпадет ни с одним прежним'''
+    keys = [GENERATION_KEY.format(scope) for scope in scopes]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            generations[key] = _now()
+            cache.add(key, generations[key], timeout=None)
+    return [generations[key] for key in keys]
+
+
+def get_generation(scope):
+    return get_generations([scope])[0]
+
+
+def bump_generations(scopes):
+    '''Сбрасывает кеш страниц после изменения публикации, комментария
+    или подписки'''
+    keys = [GENERATION_KEY.format(scope) for scope in set(scopes)]
+    current = cache.get_many(keys)
+    now = _now()
+    cache.set_many({key: max(now, current.get(key, 0) + 1) for key in keys},
+                   timeout=None)
+
+
+def feed_cache_key(request, scope, page):
+    '''Ключ фрагмента ленты, общий для всех читателей. Отдельная копия
+    нужна только автору публикаций на странице: ему показываются
+    ссылки редактирования'''
+    owner = ''
+    user = request.user
+    if user.is_authenticated and any(
+            post.author_id == user.pk for post in page):
+        owner = user.pk
+    return '{}:{}:{!r}:{}'.format(scope, get_generation(scope), page, owner)
+
+
+def cache_anonymous_page(get_scopes):
+    '''Кеширует страницу целиком для неавторизованных посетителей и
+    отвечает 304 на If-None-Match/If-Modified-Since без отрисовки.
+    get_scopes получает аргументы представления и возвращает список
+    поколений, от которых зависит страница, или None, если страницу
+    кешировать не нужно'''
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.user.is_authenticated:
+                response = view(request, *args, **kwargs)
+                patch_cache_control(response, private=True)
+                return response
+            scopes = None
+            if request.method in ('GET', 'HEAD'):
+                scopes = get_scopes(*args, **kwargs)
+            if scopes is None:
+                return view(request, *args, **kwargs)
+
+            generations = get_generations(scopes)
+            path = request.get_full_path()
+            etag = quote_etag(hashlib.md5('{}:{}'.format(
+                path, generations).encode()).hexdigest())
+            last_modified = max(generations) // 1000
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified)
+            if response is None:
+                page_key = PAGE_KEY.format(
+                    hashlib.md5(path.encode()).hexdigest(), etag)
+                cached = cache.get(page_key)
+                if cached is not None:
+                    content, content_type = cached
+                    response = HttpResponse(content,
+                                            content_type=content_type)
+                else:
+                    response = view(request, *args, **kwargs)
+                    if response.status_code != 200:
+                        return response
+                    cache.set(page_key, (response.content,
+                                         response['Content-Type']),
+                              PAGE_CACHE_TIMEOUT)
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+            patch_cache_control(response, public=True,
+                                max_age=settings.PAGE_CACHE_MAX_AGE)
+            patch_vary_headers(response, ('Cookie',))
+            return response
+        return wrapper
+    return decorator
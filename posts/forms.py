@@ -1,5 +1,9 @@
 from django import forms
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.template.defaultfilters import filesizeformat
 
+from .images import normalize_image
 from .models import Comment, Group, Post
 
 
@@ -15,6 +19,19 @@ class PostForm(forms.ModelForm):
                 attrs={'class': 'form-control-file'}),
         }
 
+    def clean_image(self):
+        '''Проверяет размер загруженного изображения и нормализует его'''
+        image = self.cleaned_data.get('image')
+        if not isinstance(image, UploadedFile):
+            return image
+        max_size = settings.POST_IMAGE_MAX_SIZE
+        if image.size > max_size:
+            raise forms.ValidationError(
+                'Размер изображения не должен превышать %(size)s',
+                code='file_too_large',
+                params={'size': filesizeformat(max_size)})
+        return normalize_image(image)
+
 
 class CommentForm(forms.ModelForm):
     '''Форма создания комментария'''
@@ -0,0 +1,35 @@
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+
+def has_alpha(image):
+    return image.mode in ('RGBA', 'LA') or (
+        image.mode == 'P' and 'transparency' in image.info)
+
+
+def normalize_image(upload):
+    '''Готовит загруженное изображение к хранению: поворачивает по EXIF,
+    уменьшает до POST_IMAGE_MAX_SIDE по большей стороне и пересохраняет
+    без метаданных. Прозрачные изображения сохраняются в PNG,
+    остальные - в JPEG'''
+    upload.seek(0)
+    with Image.open(upload) as source:
+        image = ImageOps.exif_transpose(source)
+        transparent = has_alpha(image)
+        image = image.convert('RGBA' if transparent else 'RGB')
+    max_side = settings.POST_IMAGE_MAX_SIDE
+    image.thumbnail((max_side, max_side), Image.LANCZOS)
+    buffer = BytesIO()
+    if transparent:
+        image.save(buffer, 'PNG', optimize=True)
+        extension = '.png'
+    else:
+        image.save(buffer, 'JPEG', quality=settings.POST_IMAGE_QUALITY,
+                   optimize=True, progressive=True)
+        extension = '.jpg'
+    name = os.path.splitext(os.path.basename(upload.name))[0] + extension
+    return ContentFile(buffer.getvalue(), name=name)
@@ -0,0 +1,246 @@
+import json
+import random
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import timedelta
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import (CaptureQueriesContext,
+                               setup_test_environment,
+                               teardown_test_environment)
+from django.urls import reverse
+from django.utils import timezone
+
+from posts import urls
+from posts.models import Comment, Follow, Group, Post, User
+from posts.transfer import REBUILD_COMMANDS, keep_timestamps
+
+# Объем данных при --scale 1
+USERS = 200
+GROUPS = 10
+POSTS = 2000
+COMMENTS = 5000
+FOLLOWS_PER_USER = 20
+
+# Маршруты, которые меняют данные даже при GET
+SKIPPED_ROUTES = ('profile_follow', 'profile_unfollow', 'post_delete',
+                  'delete_comment')
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(timings, percent):
+    '''Перцентиль по методу ближайшего ранга'''
+    ordered = sorted(timings)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[rank - 1]
+
+
+@contextmanager
+def capture_queries():
+    '''Запросы ко всем базам: GET-запросы читают с реплик'''
+    with ExitStack() as stack:
+        yield [stack.enter_context(CaptureQueriesContext(db))
+               for db in connections.all()]
+
+
+class Command(BaseCommand):
+    help = ('Заполняет одноразовую базу воспроизводимым набором данных и '
+            'замеряет время ответа и число запросов для каждого маршрута '
+            'posts.urls, анонимно и под пользователем')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1,
+                            help='Множитель объема данных')
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--requests', type=int, default=50,
+                            help='Число замеров для каждого маршрута')
+        parser.add_argument('--output', help='Файл для результатов в JSON')
+        parser.add_argument('--baseline',
+                            help='Файл прошлых результатов для сравнения')
+        parser.add_argument('--tolerance', type=float, default=0.2,
+                            help='Допустимый рост p95 относительно '
+                                 'baseline, доля')
+        parser.add_argument('--keepdb', action='store_true',
+                            help='Не удалять тестовую базу и использовать '
+                                 'уже заполненную')
+        parser.add_argument('--current-db', action='store_true',
+                            help='Заполнить текущую пустую базу вместо '
+                                 'создания тестовой')
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline']) as baseline_file:
+                baseline = json.load(baseline_file)
+        try:
+            setup_test_environment()
+        except RuntimeError:
+            # Команда запущена из тестов, окружение уже настроено
+            teardown = False
+        else:
+            teardown = True
+        old_name = None
+        replica_names = {}
+        if not options['current_db']:
+            old_name = connection.settings_dict['NAME']
+            connection.creation.create_test_db(
+                verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+            # Реплики читают ту же тестовую базу, как в тестах
+            for alias in settings.REPLICA_DATABASES:
+                replica = connections[alias]
+                replica.close()
+                replica_names[alias] = replica.settings_dict['NAME']
+                replica.creation.set_as_test_mirror(connection.settings_dict)
+        try:
+            if not Post.objects.exists():
+                self.seed(options['scale'], random.Random(options['seed']))
+            results = self.measure(options['requests'])
+        finally:
+            for alias, name in replica_names.items():
+                connections[alias].close()
+                connections[alias].settings_dict['NAME'] = name
+            if old_name is not None:
+                connection.creation.destroy_test_db(
+                    old_name, verbosity=0, keepdb=options['keepdb'])
+            if teardown:
+                teardown_test_environment()
+
+        report = json.dumps(results, indent=2, sort_keys=True)
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                output.write(report + '\n')
+        else:
+            self.stdout.write(report)
+        if baseline is not None:
+            regressions = self.compare(baseline, results,
+                                       options['tolerance'])
+            if regressions:
+                raise CommandError('Замедление относительно baseline:\n'
+                                   + '\n'.join(regressions))
+
+    def seed(self, scale, rng):
+        '''Создает пользователей, группы, публикации, комментарии и граф
+        подписок со степенным распределением числа подписчиков'''
+        users_count = max(2, int(USERS * scale))
+        password = make_password('benchmark')
+        User.objects.bulk_create(
+            User(username='user{}'.format(number), password=password)
+            for number in range(users_count))
+        user_ids = list(User.objects.order_by('pk').values_list(
+            'pk', flat=True))
+        Group.objects.bulk_create(
+            Group(title='Группа {}'.format(number),
+                  slug='group-{}'.format(number),
+                  description='Описание группы')
+            for number in range(max(1, int(GROUPS * scale))))
+        group_ids = list(Group.objects.values_list('pk', flat=True))
+
+        # Авторы и подписки распределены по закону Ципфа: несколько
+        # популярных авторов и длинный хвост
+        weights = list(accumulate(1 / (rank + 1)
+                                  for rank in range(len(user_ids))))
+        now = timezone.now()
+        minutes_in_year = 60 * 24 * 365
+        posts = (Post(author_id=rng.choices(user_ids,
+                                            cum_weights=weights)[0],
+                      group_id=rng.choice(group_ids + [None]),
+                      text=self.text(rng),
+                      pub_date=now - timedelta(
+                          minutes=rng.randrange(minutes_in_year)),
+                      updated_at=now)
+                 for _ in range(int(POSTS * scale)))
+        self.bulk_create(Post, posts)
+        post_ids = list(Post.objects.values_list('pk', flat=True))
+        comments = (Comment(post_id=rng.choice(post_ids),
+                            author_id=rng.choice(user_ids),
+                            text=self.text(rng),
+                            created=now - timedelta(
+                                minutes=rng.randrange(minutes_in_year)),
+                            updated_at=now)
+                    for _ in range(int(COMMENTS * scale)))
+        self.bulk_create(Comment, comments)
+        follows = []
+        for user_id in user_ids:
+            count = min(len(user_ids) - 1,
+                        int(rng.paretovariate(1.5) * FOLLOWS_PER_USER / 3))
+            authors = set(rng.choices(user_ids, cum_weights=weights,
+                                      k=count))
+            authors.discard(user_id)
+            follows += [Follow(user_id=user_id, author_id=author_id)
+                        for author_id in authors]
+        self.bulk_create(Follow, follows)
+        for command in REBUILD_COMMANDS:
+            call_command(command, stdout=self.stderr)
+
+    def bulk_create(self, model, objects):
+        with keep_timestamps(model):
+            model.objects.bulk_create(objects)
+
+    def text(self, rng):
+        words = ('лента', 'подписка', 'публикация', 'комментарий', 'блог',
+                 'группа', 'автор', 'читатель', 'новость', 'запись')
+        return ' '.join(rng.choice(words) for _ in range(rng.randint(5, 60)))
+
+    def routes(self):
+        '''Имена маршрутов posts.urls и адреса для замера'''
+        author = User.objects.annotate(
+            followers=Count('following')).order_by('-followers').first()
+        post = Post.objects.filter(author=author).order_by(
+            '-comment_count').first() or Post.objects.first()
+        comment = Comment.objects.filter(post=post).first()
+        group = Group.objects.first()
+        values = {'username': post.author.username, 'post_id': post.pk,
+                  'slug': group.slug,
+                  'comment_id': comment.pk if comment else 0}
+        for pattern in urls.urlpatterns:
+            if not pattern.name or pattern.name in SKIPPED_ROUTES:
+                continue
+            kwargs = {name: values[name]
+                      for name in pattern.pattern.converters}
+            yield pattern.name, reverse(pattern.name, kwargs=kwargs)
+
+    def measure(self, requests):
+        reader = User.objects.annotate(
+            follows=Count('follower')).order_by('-follows').first()
+        clients = {'anonymous': Client(), 'authenticated': Client()}
+        clients['authenticated'].force_login(reader)
+        results = {}
+        for name, url in self.routes():
+            for kind, client in clients.items():
+                client.get(url)
+                timings = []
+                for _ in range(requests):
+                    with capture_queries() as queries:
+                        start = time.perf_counter()
+                        response = client.get(url)
+                        timings.append(time.perf_counter() - start)
+                result = {'url': url, 'status': response.status_code,
+                          'queries': sum(map(len, queries))}
+                for percent in PERCENTILES:
+                    result['p{}_ms'.format(percent)] = round(
+                        percentile(timings, percent) * 1000, 3)
+                results['{}:{}'.format(name, kind)] = result
+        return results
+
+    def compare(self, baseline, results, tolerance):
+        '''Маршруты, где p95 или число запросов выросли сверх допуска'''
+        regressions = []
+        for key, result in sorted(results.items()):
+            before = baseline.get(key)
+            if before is None:
+                continue
+            if result['p95_ms'] > before['p95_ms'] * (1 + tolerance):
+                regressions.append('{}: p95 {} мс, было {} мс'.format(
+                    key, result['p95_ms'], before['p95_ms']))
+            if result['queries'] > before['queries']:
+                regressions.append('{}: запросов {}, было {}'.format(
+                    key, result['queries'], before['queries']))
+        return regressions
@@ -0,0 +1,173 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from http.client import HTTPResponse
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from posts.models import Post
+
+from .benchmark import PERCENTILES, Command as Benchmark, percentile
+
+WORKER_CLASSES = ('sync', 'gthread')
+
+
+class Command(BaseCommand):
+    help = ('Сравнивает классы воркеров gunicorn на текущей базе: для '
+            'каждого запускает gunicorn и нагружает маршруты posts.urls '
+            'параллельными медленными клиентами')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--worker-classes', default=','.join(
+            WORKER_CLASSES), help='Классы воркеров через запятую')
+        parser.add_argument('--workers', type=int, default=2)
+        parser.add_argument('--threads', type=int, default=4,
+                            help='Потоков в воркере gthread')
+        parser.add_argument('--bind', default='127.0.0.1:8765')
+        parser.add_argument('--url',
+                            help='Нагрузить уже запущенный сервер вместо '
+                                 'запуска gunicorn')
+        parser.add_argument('--concurrency', type=int, default=32,
+                            help='Число одновременных клиентов')
+        parser.add_argument('--requests', type=int, default=20,
+                            help='Запросов от каждого клиента')
+        parser.add_argument('--send-delay', type=float, default=0.05,
+                            help='Пауза клиента посреди отправки запроса, '
+                                 'секунды: так ведет себя медленная сеть')
+        parser.add_argument('--output', help='Файл для результатов в JSON')
+
+    def handle(self, *args, **options):
+        if not Post.objects.exists():
+            raise CommandError('База пуста, заполните ее командой '
+                               'manage.py benchmark --current-db --keepdb')
+        paths = [url for _, url in Benchmark().routes()]
+        load = dict(paths=paths, concurrency=options['concurrency'],
+                    requests=options['requests'],
+                    send_delay=options['send_delay'])
+        if options['url']:
+            results = {options['url']: self.run_load(options['url'], **load)}
+        else:
+            results = {}
+            for worker_class in options['worker_classes'].split(','):
+                with self.server(worker_class, options):
+                    results[worker_class] = self.run_load(
+                        'http://' + options['bind'], **load)
+
+        report = json.dumps(results, indent=2, sort_keys=True)
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                output.write(report + '\n')
+        else:
+            self.stdout.write(report)
+
+    def server(self, worker_class, options):
+        '''Запускает gunicorn с настройками из gunicorn.conf.py'''
+        # В gunicorn 20.0 нет python -m gunicorn
+        command = [sys.executable, '-c',
+                   'from gunicorn.app.wsgiapp import run; run()',
+                   'yatube.wsgi',
+                   '--config', os.path.join(settings.BASE_DIR,
+                                            'gunicorn.conf.py'),
+                   '--worker-class', worker_class,
+                   '--workers', str(options['workers']),
+                   '--threads', str(options['threads']),
+                   '--bind', options['bind']]
+        return GunicornProcess(command, options['bind'])
+
+    def run_load(self, base_url, paths, concurrency, requests, send_delay):
+        '''Каждый клиент по очереди запрашивает адреса из paths'''
+        parts = urlsplit(base_url)
+        timings = []
+        errors = []
+        lock = threading.Lock()
+
+        def client(number):
+            address = (parts.hostname, parts.port or 80)
+            connection = None
+            for index in range(requests):
+                path = paths[(number + index) % len(paths)]
+                start = time.perf_counter()
+                try:
+                    if connection is None:
+                        connection = socket.create_connection(address, 60)
+                    status, keep_alive = self.request(
+                        connection, parts.netloc, path, send_delay)
+                except OSError as error:
+                    status, keep_alive = error, False
+                if not keep_alive and connection is not None:
+                    connection.close()
+                    connection = None
+                duration = time.perf_counter() - start
+                with lock:
+                    if isinstance(status, int) and status < 500:
+                        timings.append(duration)
+                    else:
+                        errors.append(str(status))
+            if connection is not None:
+                connection.close()
+
+        start = time.perf_counter()
+        clients = [threading.Thread(target=client, args=(number,))
+                   for number in range(concurrency)]
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        result = {'requests': len(timings), 'errors': len(errors),
+                  'requests_per_second': round(len(timings) / elapsed, 1)}
+        for percent in PERCENTILES:
+            result['p{}_ms'.format(percent)] = round(
+                percentile(timings, percent) * 1000, 3) if timings else None
+        return result
+
+    def request(self, connection, host, path, send_delay):
+        '''GET с паузой между строкой запроса и заголовками. Возвращает
+        статус ответа и можно ли отправить следующий запрос в то же
+        соединение'''
+        connection.sendall('GET {} HTTP/1.1\r\nHost: {}\r\n'.format(
+            path, host).encode())
+        time.sleep(send_delay)
+        connection.sendall(b'Accept-Encoding: gzip\r\n\r\n')
+        response = HTTPResponse(connection, method='GET')
+        response.begin()
+        response.read()
+        return response.status, not response.will_close
+
+
+class GunicornProcess:
+    def __init__(self, command, bind):
+        self.command = command
+        self.host, port = bind.rsplit(':', 1)
+        self.port = int(port)
+
+    def __enter__(self):
+        self.process = subprocess.Popen(self.command,
+                                        cwd=settings.BASE_DIR,
+                                        stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise CommandError('gunicorn завершился при запуске: '
+                                   + ' '.join(self.command))
+            try:
+                socket.create_connection((self.host, self.port), 1).close()
+                return self
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__()
+        raise CommandError('gunicorn не начал принимать соединения')
+
+    def __exit__(self, *exc_info):
+        self.process.terminate()
+        try:
+            self.process.wait(10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
@@ -0,0 +1,26 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Min
+
+from posts.models import Follow
+
+
+class Command(BaseCommand):
+    help = ('Удаляет повторные подписки перед добавлением ограничения '
+            'уникальности (user, author)')
+
+    def handle(self, *args, **options):
+        duplicates = Follow.objects.values('user', 'author').annotate(
+            keep=Min('pk'), count=Count('pk')).filter(count__gt=1)
+        removed = 0
+        with transaction.atomic():
+            for row in list(duplicates):
+                deleted, _ = Follow.objects.filter(
+                    user=row['user'], author=row['author']).exclude(
+                        pk=row['keep']).delete()
+                removed += deleted
+        if removed:
+            call_command('rebuild_profile_stats', stdout=self.stdout)
+            call_command('rebuild_timelines', stdout=self.stdout)
+        self.stdout.write('Удалено повторных подписок: {}'.format(removed))
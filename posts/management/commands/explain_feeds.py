@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from posts.models import Comment, Follow, Group, Post, User
+from posts.timeline import follow_feed
+from posts.views import POSTS_PER_PAGE
+
+
+class Command(BaseCommand):
+    help = ('Выводит планы выполнения (EXPLAIN) запросов лент, чтобы '
+            'проверить использование индексов на заполненной базе')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', help='Формат плана, например json '
+                                             'для PostgreSQL')
+        parser.add_argument('--analyze', action='store_true',
+                            help='Выполнить запросы (EXPLAIN ANALYZE, '
+                                 'только PostgreSQL)')
+
+    def handle(self, *args, **options):
+        author = User.objects.annotate(
+            followers=Count('following')).order_by('-followers').first()
+        follower = User.objects.annotate(
+            follows=Count('follower')).order_by('-follows').first()
+        group = Group.objects.first()
+        post = Post.objects.order_by('-comment_count').first()
+        if not (author and follower and group and post):
+            raise CommandError('Для отчета нужны пользователи, группы и '
+                               'публикации в базе')
+        explain_options = {}
+        if options['analyze']:
+            explain_options['analyze'] = True
+        for name, queryset in self.queries(author, follower, group, post):
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(queryset.explain(format=options['format'],
+                                               **explain_options))
+            self.stdout.write('')
+
+    def queries(self, author, follower, group, post):
+        feed = Post.objects.select_related('author', 'group').order_by(
+            '-pub_date', '-pk')
+        page = slice(0, POSTS_PER_PAGE + 1)
+        follow_list, options = follow_feed(follower)
+        key = options.get('key', ('pub_date', 'pk'))
+        yield 'index', feed[page]
+        yield 'group', feed.filter(group=group)[page]
+        yield 'profile', feed.filter(author=author)[page]
+        yield 'follow_index', follow_list.filter(options['where']).order_by(
+            *('-' + field for field in key))[page]
+        yield 'post comments', Comment.objects.filter(
+            post=post).select_related('author').order_by('-created')
+        yield 'following check', Follow.objects.filter(
+            author=author, user=follower)[:1]
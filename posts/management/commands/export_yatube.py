@@ -0,0 +1,34 @@
+import sys
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from posts.transfer import MODELS
+
+
+class Command(BaseCommand):
+    help = ('Выгружает пользователей, группы, публикации, комментарии и '
+            'подписки в JSONL, читая базу порциями')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', help='Файл выгрузки (по умолчанию '
+                                             'стандартный вывод)')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        output = sys.stdout
+        if options['output']:
+            output = open(options['output'], 'w', encoding='utf-8')
+        encoder = DjangoJSONEncoder(ensure_ascii=False)
+        total = 0
+        try:
+            for name, model, fields in MODELS:
+                rows = model.objects.order_by('pk').values(*fields)
+                for row in rows.iterator(chunk_size=options['chunk_size']):
+                    output.write(encoder.encode(
+                        {'model': name, 'fields': row}) + '\n')
+                    total += 1
+        finally:
+            if output is not sys.stdout:
+                output.close()
+        self.stderr.write('Выгружено записей: {}'.format(total))
@@ -0,0 +1,48 @@
+import multiprocessing
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from posts.models import Post
+from posts.thumbnails import generate_thumbnails
+
+
+def generate(name):
+    try:
+        generate_thumbnails(name)
+    except Exception as error:
+        return name, str(error)
+    return name, None
+
+
+def close_connections():
+    # Дочерние процессы не должны использовать соединения родителя
+    connections.close_all()
+
+
+class Command(BaseCommand):
+    help = ('Создает недостающие миниатюры изображений публикаций '
+            'в нескольких процессах')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int,
+                            default=multiprocessing.cpu_count(),
+                            help='Число процессов (по умолчанию - по числу '
+                                 'процессоров)')
+
+    def handle(self, *args, **options):
+        names = list(Post.objects.exclude(image='').values_list(
+            'image', flat=True).distinct())
+        close_connections()
+        done = failed = 0
+        with multiprocessing.Pool(options['processes'],
+                                  initializer=close_connections) as pool:
+            for name, error in pool.imap_unordered(generate, names,
+                                                   chunksize=16):
+                if error:
+                    failed += 1
+                    self.stderr.write('{}: {}'.format(name, error))
+                else:
+                    done += 1
+        self.stdout.write('Обработано изображений: {}, с ошибками: {}'
+                          .format(done, failed))
@@ -0,0 +1,79 @@
+import json
+import os
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from posts.transfer import (MODELS, REBUILD_COMMANDS, keep_timestamps,
+                            to_instance)
+
+
+class Command(BaseCommand):
+    help = ('Загружает JSONL-выгрузку export_yatube порциями через '
+            'bulk_create. Прерванную загрузку можно продолжить')
+
+    def add_arguments(self, parser):
+        parser.add_argument('input', help='Файл выгрузки')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--progress-file',
+                            help='Файл с числом загруженных строк '
+                                 '(по умолчанию <input>.progress)')
+        parser.add_argument('--no-rebuild', action='store_true',
+                            help='Не пересчитывать счетчики, ленты и '
+                                 'поисковый индекс после загрузки')
+
+    def handle(self, *args, **options):
+        self.models = {name: model for name, model, _ in MODELS}
+        self.progress_file = (options['progress_file']
+                              or options['input'] + '.progress')
+        done = self.read_progress()
+        if done:
+            self.stdout.write('Продолжение со строки {}'.format(done + 1))
+        batch_model, batch = None, []
+        line_number = 0
+        with open(options['input'], encoding='utf-8') as source:
+            for line_number, line in enumerate(source, 1):
+                if line_number <= done or not line.strip():
+                    continue
+                record = json.loads(line)
+                model = self.models.get(record['model'])
+                if model is None:
+                    raise CommandError('Строка {}: неизвестная модель {}'
+                                       .format(line_number, record['model']))
+                if batch and (model is not batch_model
+                              or len(batch) >= options['batch_size']):
+                    self.flush(batch_model, batch, line_number - 1)
+                    batch = []
+                batch_model = model
+                batch.append(to_instance(model, record['fields']))
+        if batch:
+            self.flush(batch_model, batch, line_number)
+        self.reset_sequences()
+        if not options['no_rebuild']:
+            for command in REBUILD_COMMANDS:
+                call_command(command, stdout=self.stdout)
+        if os.path.exists(self.progress_file):
+            os.remove(self.progress_file)
+        self.stdout.write('Загружено строк: {}'.format(line_number - done))
+
+    def flush(self, model, batch, line_number):
+        '''Сохраняет порцию и запоминает, до какой строки дошла загрузка'''
+        with transaction.atomic(), keep_timestamps(model):
+            model.objects.bulk_create(batch, ignore_conflicts=True)
+        with open(self.progress_file, 'w') as progress:
+            progress.write(str(line_number))
+
+    def read_progress(self):
+        if not os.path.exists(self.progress_file):
+            return 0
+        with open(self.progress_file) as progress:
+            return int(progress.read().strip() or 0)
+
+    def reset_sequences(self):
+        statements = connection.ops.sequence_reset_sql(
+            no_style(), list(self.models.values()))
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
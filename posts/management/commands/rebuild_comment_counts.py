@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from posts.models import Comment, Post
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает сохраненное число комментариев у публикаций'
+
+    def handle(self, *args, **options):
+        comment_count = Comment.objects.filter(
+            post=OuterRef('pk')).order_by().values('post').annotate(
+                count=Count('pk')).values('count')
+        updated = Post.objects.update(
+            comment_count=Coalesce(Subquery(comment_count), 0))
+        self.stdout.write(
+            'Пересчитано публикаций: {}'.format(updated))
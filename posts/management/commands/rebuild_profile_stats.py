@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from posts.models import Follow, Post, ProfileStats, User
+
+BATCH_SIZE = 1000
+# CASE WHEN в bulk_update растет с числом строк
+UPDATE_BATCH_SIZE = 100
+FIELDS = ('follower_count', 'following_count', 'post_count')
+
+
+def count_subquery(queryset, field):
+    '''Подзапрос с числом строк queryset для каждого пользователя'''
+    return Coalesce(Subquery(
+        queryset.filter(**{field: OuterRef('pk')}).order_by().values(
+            field).annotate(count=Count('pk')).values('count'),
+        output_field=IntegerField()), 0)
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает статистику профилей всех пользователей'
+
+    def handle(self, *args, **options):
+        users = User.objects.annotate(
+            follower_count=count_subquery(Follow.objects, 'author'),
+            following_count=count_subquery(Follow.objects, 'user'),
+            post_count=count_subquery(Post.objects, 'author'),
+        ).values_list('pk', 'follower_count', 'following_count',
+                      'post_count')
+        total = 0
+        batch = []
+        for pk, followers, following, posts in users.iterator():
+            batch.append(ProfileStats(user_id=pk,
+                                      follower_count=followers,
+                                      following_count=following,
+                                      post_count=posts))
+            if len(batch) >= BATCH_SIZE:
+                self.save(batch)
+                total += len(batch)
+                batch = []
+        self.save(batch)
+        total += len(batch)
+        self.stdout.write('Пересчитано профилей: {}'.format(total))
+
+    def save(self, batch):
+        '''Записывает счетчики, не удаляя существующие строки: читатели
+        не видят пустой статистики, а строки, созданные сигналами во
+        время пересчета, не мешают вставке'''
+        with transaction.atomic():
+            ProfileStats.objects.bulk_create(batch, ignore_conflicts=True)
+            ProfileStats.objects.bulk_update(
+                batch, FIELDS, batch_size=UPDATE_BATCH_SIZE)
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from posts import search
+from posts.models import Comment, Post
+
+
+class Command(BaseCommand):
+    help = 'Заново строит поисковый индекс публикаций и комментариев'
+
+    def handle(self, *args, **options):
+        search.create_index()
+        total = 0
+        with transaction.atomic():
+            search.clear_index()
+            posts = Post.objects.values_list('pk', 'text')
+            for pk, text in posts.iterator():
+                search.index_document(search.POST, pk, pk, text)
+                total += 1
+            comments = Comment.objects.values_list('pk', 'post_id', 'text')
+            for pk, post_id, text in comments.iterator():
+                search.index_document(search.COMMENT, pk, post_id, text)
+                total += 1
+        self.stdout.write('Проиндексировано документов: {}'.format(total))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from posts import timeline
+from posts.models import Follow, TimelineEntry
+
+
+class Command(BaseCommand):
+    help = 'Заново заполняет ленты подписок по таблице подписок'
+
+    def handle(self, *args, **options):
+        follows = Follow.objects.values_list('user_id', 'author_id')
+        total = 0
+        with transaction.atomic():
+            TimelineEntry.objects.all().delete()
+            for follower_id, author_id in follows.iterator():
+                timeline.backfill(follower_id, author_id)
+                total += 1
+        self.stdout.write('Обработано подписок: {}'.format(total))
@@ -31,10 +31,24 @@ class Post(models.Model):
                               verbose_name="Группа")
     image = models.ImageField(
         upload_to='posts/', blank=True, verbose_name="Изображение")
+    comment_count = models.PositiveIntegerField(
+        "Число комментариев", default=0, editable=False)
+    updated_at = models.DateTimeField("Дата изменения", auto_now=True)
+    fanned_out = models.BooleanField(
+        "Записана в ленты подписчиков", default=True, editable=False)
 
     class Meta:
         verbose_name = "Публикация"
         verbose_name_plural = "Публикации"
+        indexes = [
+            models.Index(fields=["group", "-pub_date", "-id"],
+                         name="posts_post_group_feed_idx"),
+            models.Index(fields=["author", "-pub_date", "-id"],
+                         name="posts_post_author_feed_idx"),
+            models.Index(fields=["author"],
+                         condition=models.Q(fanned_out=False),
+                         name="posts_post_fan_in_idx"),
+        ]
 
     def __str__(self):
         return self.text
@@ -49,11 +63,17 @@ class Comment(models.Model):
                                related_name="comment_author",
                                verbose_name="Автор")
     text = models.TextField(verbose_name="Текст")
-    created = models.DateTimeField("Дата публикации", auto_now_add=True)
+    created = models.DateTimeField("Дата публикации", auto_now_add=True,
+                                   db_index=True)
+    updated_at = models.DateTimeField("Дата изменения", auto_now=True)
 
     class Meta:
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
+        indexes = [
+            models.Index(fields=["post", "-created"],
+                         name="posts_comment_post_idx"),
+        ]
 
     def __str__(self):
         return self.text
@@ -71,3 +91,70 @@ class Follow(models.Model):
     class Meta:
         verbose_name = "Подписка"
         verbose_name_plural = "Подписки"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "author"],
+                                    name="posts_follow_unique"),
+        ]
+
+
+class ProfileStats(models.Model):
+    '''Предрасчитанные счетчики профиля пользователя'''
+    user = models.OneToOneField(User, on_delete=models.CASCADE,
+                                primary_key=True, related_name="stats",
+                                verbose_name="Пользователь")
+    follower_count = models.PositiveIntegerField("Подписчиков", default=0)
+    following_count = models.PositiveIntegerField("Подписок", default=0)
+    post_count = models.PositiveIntegerField("Публикаций", default=0)
+
+    class Meta:
+        verbose_name = "Статистика профиля"
+        verbose_name_plural = "Статистика профилей"
+
+    @classmethod
+    def rebuild(cls, user_id):
+        '''Пересчитывает счетчики пользователя по исходным таблицам'''
+        stats, _ = cls.objects.update_or_create(user_id=user_id, defaults={
+            'follower_count': Follow.objects.filter(author_id=user_id).count(),
+            'following_count': Follow.objects.filter(user_id=user_id).count(),
+            'post_count': Post.objects.filter(author_id=user_id).count(),
+        })
+        return stats
+
+    @classmethod
+    def for_user(cls, user):
+        '''Счетчики пользователя, загруженного через select_related("stats")'''
+        try:
+            return user.stats
+        except cls.DoesNotExist:
+            return cls.rebuild(user.pk)
+
+
+class TimelineEntry(models.Model):
+    '''Публикация в ленте подписчика, записывается при публикации'''
+    follower = models.ForeignKey(User, on_delete=models.CASCADE,
+                                 related_name="timeline",
+                                 verbose_name="Подписчик")
+    post = models.ForeignKey(Post, on_delete=models.CASCADE,
+                             related_name="timeline",
+                             verbose_name="Публикация")
+    pub_date = models.DateTimeField("Дата публикации")
+
+    class Meta:
+        verbose_name = "Запись ленты"
+        verbose_name_plural = "Записи ленты"
+        unique_together = ("follower", "post")
+        indexes = [
+            models.Index(fields=["follower", "-pub_date", "-post"],
+                         name="posts_timeline_feed_idx"),
+        ]
+
+
+class CacheSequence(models.Model):
+    '''Счетчик журнала инвалидаций двухуровневого кеша. Номер выделяется
+    одним UPDATE, поэтому воркеры не получают одинаковых номеров'''
+    name = models.CharField("Название", max_length=255, primary_key=True)
+    value = models.BigIntegerField("Значение", default=0)
+
+    class Meta:
+        verbose_name = "Счетчик кеша"
+        verbose_name_plural = "Счетчики кеша"
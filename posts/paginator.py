@@ -0,0 +1,146 @@
+import base64
+import binascii
+from collections.abc import Sequence
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(Exception):
+    '''Курсор не удалось разобрать'''
+
+
+def encode_cursor(date, pk):
+    '''Кодирует ключ (дата, id) в строку для адреса страницы'''
+    raw = '{}|{}'.format(date.isoformat(), pk)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    '''Восстанавливает ключ (дата, id) из строки курсора'''
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        pub_date, pk = raw.rsplit('|', 1)
+        return datetime.fromisoformat(pub_date), int(pk)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise InvalidCursor(cursor)
+
+
+class CursorPage(Sequence):
+    '''Страница, полученная переходом по курсору'''
+    is_cursor = True
+
+    def __init__(self, object_list, paginator, cursor,
+                 has_previous, has_next):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.cursor = cursor
+        self._has_previous = has_previous
+        self._has_next = has_next
+
+    def __repr__(self):
+        return '<CursorPage {}>'.format(self.cursor or 'first')
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_previous or self._has_next
+
+    @property
+    def next_cursor(self):
+        '''Курсор на более старые записи'''
+        if not self._has_next:
+            return None
+        return self.paginator.cursor_for(self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        '''Курсор на более новые записи'''
+        if not self._has_previous or not self.object_list:
+            return None
+        return self.paginator.cursor_for(self.object_list[0])
+
+
+class CursorPaginator:
+    '''Постраничный вывод по ключу (pub_date, id) без OFFSET и COUNT.
+    В key можно передать поля, по которым ключ хранится в индексе
+    связанной таблицы, например в ленте подписок. Условие на такую
+    связь передается в where, чтобы оно попало в тот же filter(), что и
+    условие курсора, и Django не добавил к запросу второй JOIN.
+    row_key - имена значений ключа в самих записях: object_list может
+    быть и выборкой словарей через values()'''
+    def __init__(self, object_list, per_page, key=('pub_date', 'pk'),
+                 where=None, row_key=('pub_date', 'id')):
+        self.object_list = object_list
+        self.per_page = per_page
+        self.key = key
+        self.where = where or Q()
+        self.row_key = row_key
+
+    @cached_property
+    def count(self):
+        '''Общее число записей, считается только если его запросил шаблон'''
+        return self.object_list.filter(self.where).count()
+
+    def cursor_for(self, row):
+        '''Курсор, указывающий на запись row'''
+        if isinstance(row, dict):
+            return encode_cursor(*(row[name] for name in self.row_key))
+        return encode_cursor(*(getattr(row, name) for name in self.row_key))
+
+    def get_page(self, after=None, before=None):
+        '''Возвращает страницу старше курсора after или новее before,
+        при отсутствующем или испорченном курсоре - первую страницу'''
+        try:
+            if before:
+                page = self._page_before(before, decode_cursor(before))
+                if page:
+                    return page
+            elif after:
+                return self._page_after(after, decode_cursor(after))
+        except InvalidCursor:
+            pass
+        return self._page_after(None, None)
+
+    def _seek(self, key, lookup):
+        date_field, pk_field = self.key
+        pub_date, pk = key
+        return (Q(**{date_field + lookup: pub_date})
+                | Q(**{date_field: pub_date, pk_field + lookup: pk}))
+
+    def _page_after(self, cursor, key):
+        date_field, pk_field = self.key
+        where = self.where
+        if key is not None:
+            where &= self._seek(key, '__lt')
+        post_list = self.object_list.filter(where).order_by(
+            '-' + date_field, '-' + pk_field)
+        rows = list(post_list[:self.per_page + 1])
+        if cursor is not None:
+            cursor = 'after:' + cursor
+        return CursorPage(rows[:self.per_page], self, cursor,
+                          has_previous=key is not None,
+                          has_next=len(rows) > self.per_page)
+
+    def _page_before(self, cursor, key):
+        post_list = self.object_list.filter(
+            self.where & self._seek(key, '__gt')).order_by(*self.key)
+        rows = list(post_list[:self.per_page + 1])
+        if not rows:
+            return None
+        return CursorPage(rows[:self.per_page][::-1], self,
+                          'before:' + cursor,
+                          has_previous=len(rows) > self.per_page,
+                          has_next=True)
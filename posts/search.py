@@ -0,0 +1,202 @@
+import base64
+import binascii
+import re
+
+from django.conf import settings
+from django.db import connection, connections
+
+from .models import Post
+
+# Строки индекса: публикация и комментарий с одним id не должны
+# совпасть, поэтому номер строки - id * 2 плюс вид документа
+POST, COMMENT = 0, 1
+
+SQLITE_SCHEMA = (
+    'CREATE VIRTUAL TABLE IF NOT EXISTS posts_search USING fts5('
+    'post_id UNINDEXED, text)',
+)
+
+POSTGRESQL_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS posts_search ('
+    'id bigint PRIMARY KEY, post_id integer NOT NULL, '
+    'document tsvector NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS posts_search_document_idx '
+    'ON posts_search USING gin (document)',
+    'CREATE INDEX IF NOT EXISTS posts_search_post_idx '
+    'ON posts_search (post_id)',
+)
+
+
+class InvalidCursor(Exception):
+    '''Курсор результатов поиска не удалось разобрать'''
+
+
+def _row_id(kind, pk):
+    return pk * 2 + kind
+
+
+def create_index(using='default', **kwargs):
+    '''Создает таблицу поискового индекса, если ее еще нет'''
+    conn = connections[using]
+    schema = {'sqlite': SQLITE_SCHEMA,
+              'postgresql': POSTGRESQL_SCHEMA}.get(conn.vendor, ())
+    with conn.cursor() as cursor:
+        for statement in schema:
+            cursor.execute(statement)
+
+
+def index_document(kind, pk, post_id, text):
+    '''Добавляет или обновляет документ в индексе'''
+    row_id = _row_id(kind, pk)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                'INSERT INTO posts_search (id, post_id, document) '
+                'VALUES (%s, %s, to_tsvector(%s, %s)) '
+                'ON CONFLICT (id) DO UPDATE SET '
+                'post_id = EXCLUDED.post_id, document = EXCLUDED.document',
+                [row_id, post_id, settings.SEARCH_CONFIG, text])
+        else:
+            cursor.execute('DELETE FROM posts_search WHERE rowid = %s',
+                           [row_id])
+            cursor.execute(
+                'INSERT INTO posts_search (rowid, post_id, text) '
+                'VALUES (%s, %s, %s)', [row_id, post_id, text])
+
+
+def remove_document(kind, pk):
+    '''Убирает документ из индекса'''
+    column = 'id' if connection.vendor == 'postgresql' else 'rowid'
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'DELETE FROM posts_search WHERE {} = %s'.format(column),
+            [_row_id(kind, pk)])
+
+
+def remove_post(post_id):
+    '''Убирает из индекса публикацию вместе со всеми комментариями к ней.
+    Вызывается до удаления, пока комментарии еще есть в базе'''
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('DELETE FROM posts_search WHERE post_id = %s',
+                           [post_id])
+            return
+        # post_id в FTS5 не индексируется, строки ищутся по rowid
+        cursor.execute(
+            'DELETE FROM posts_search WHERE rowid = %s OR rowid IN ('
+            'SELECT id * 2 + %s FROM posts_comment WHERE post_id = %s)',
+            [_row_id(POST, post_id), COMMENT, post_id])
+
+
+def clear_index():
+    with connection.cursor() as cursor:
+        cursor.execute('DELETE FROM posts_search')
+
+
+def encode_cursor(score, pk):
+    raw = '{!r}|{}'.format(score, pk)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        score, pk = raw.rsplit('|', 1)
+        return float(score), int(pk)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise InvalidCursor(cursor)
+
+
+def _fts5_match(query):
+    # Слова запроса экранируются, чтобы пользователь не мог
+    # использовать синтаксис FTS5, и ищутся по префиксу
+    words = re.findall(r'\w+', query)
+    return ' '.join('"{}"*'.format(word) for word in words)
+
+
+def _matches_sql(query):
+    '''Запрос, возвращающий (post_id, score) лучших совпадений.
+    Меньший score - лучшее совпадение'''
+    if connection.vendor == 'postgresql':
+        # ts_rank возвращает real, а курсор сравнивается как float8:
+        # без приведения равные оценки на границе страницы не совпадут
+        return ('SELECT post_id, (-MAX(ts_rank(document, query)))::float8 '
+                'AS score '
+                'FROM posts_search, plainto_tsquery(%s, %s) query '
+                'WHERE document @@ query GROUP BY post_id',
+                [settings.SEARCH_CONFIG, query])
+    match = _fts5_match(query)
+    # rank - скрытый столбец FTS5 со значением bm25(); сама функция
+    # bm25() во вложенном запросе недоступна
+    return ('SELECT post_id, MIN(score) AS score FROM ('
+            'SELECT post_id, rank AS score '
+            'FROM posts_search WHERE posts_search MATCH %s) '
+            'GROUP BY post_id', [match])
+
+
+def matching_ids(kind, query, limit):
+    '''id самых релевантных публикаций или комментариев (по kind)'''
+    if not re.search(r'\w', query):
+        return []
+    if connection.vendor == 'postgresql':
+        sql = ('SELECT id FROM posts_search, plainto_tsquery(%s, %s) query '
+               'WHERE document @@ query AND id %% 2 = %s '
+               'ORDER BY ts_rank(document, query) DESC LIMIT %s')
+        params = [settings.SEARCH_CONFIG, query, kind, limit]
+    else:
+        sql = ('SELECT rowid FROM posts_search WHERE posts_search MATCH %s '
+               'AND rowid %% 2 = %s ORDER BY rank LIMIT %s')
+        params = [_fts5_match(query), kind, limit]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row_id // 2 for row_id, in cursor.fetchall()]
+
+
+class SearchPage:
+    '''Страница результатов поиска, отсортированных по релевантности'''
+    def __init__(self, object_list, next_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+
+def search_posts(query, per_page, after=None):
+    '''Ищет публикации по тексту публикаций и комментариев к ним'''
+    if not re.search(r'\w', query):
+        return SearchPage([], None)
+    sql, params = _matches_sql(query)
+    sql = 'SELECT post_id, score FROM ({}) matches'.format(sql)
+    if after:
+        try:
+            score, pk = decode_cursor(after)
+        except InvalidCursor:
+            pass
+        else:
+            sql += ' WHERE score > %s OR (score = %s AND post_id < %s)'
+            params += [score, score, pk]
+    sql += ' ORDER BY score, post_id DESC LIMIT %s'
+    params.append(per_page + 1)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    posts = Post.objects.select_related('author', 'group').in_bulk(
+        [post_id for post_id, _ in rows[:per_page]])
+    object_list = [posts[post_id] for post_id, _ in rows[:per_page]
+                   if post_id in posts]
+    next_cursor = None
+    if len(rows) > per_page:
+        post_id, score = rows[per_page - 1]
+        next_cursor = encode_cursor(score, post_id)
+    return SearchPage(object_list, next_cursor)
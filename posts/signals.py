@@ -0,0 +1,182 @@
+import threading
+
+from django.db.models import F
+from django.db.models.signals import (post_delete, post_save, pre_delete,
+                                      pre_save)
+from django.dispatch import receiver
+
+from . import search, timeline
+from .cache import bump_generations, feed_scopes
+from .models import (Comment, Follow, Group, Post, ProfileStats,
+                     TimelineEntry)
+from .thumbnails import schedule_thumbnails
+
+# Публикации, которые удаляются в текущем потоке. Комментарии к ним
+# удаляются каскадом, и обработчики удаления комментария для них ничего
+# не делают: счетчик, индекс и кеш обновляются один раз для публикации
+_deleting = threading.local()
+
+
+def _deleting_posts():
+    if not hasattr(_deleting, 'posts'):
+        _deleting.posts = set()
+    return _deleting.posts
+
+
+@receiver(pre_delete, sender=Post)
+def post_deleting(sender, instance, **kwargs):
+    _deleting_posts().add(instance.pk)
+    search.remove_post(instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def post_gone(sender, instance, **kwargs):
+    _deleting_posts().discard(instance.pk)
+
+
+@receiver(post_save, sender=Comment)
+def comment_created(sender, instance, created, **kwargs):
+    '''Увеличивает счетчик комментариев публикации'''
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1)
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, **kwargs):
+    '''Уменьшает счетчик комментариев публикации, в том числе при
+    каскадном удалении и удалении из админки'''
+    if instance.post_id in _deleting_posts():
+        return
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1)
+
+
+def change_stats(user_id, field, delta):
+    '''Меняет счетчик профиля, недостающую запись создает пересчетом'''
+    stats = ProfileStats.objects.filter(user_id=user_id)
+    if delta < 0:
+        stats = stats.filter(**{field + '__gt': 0})
+    updated = stats.update(**{field: F(field) + delta})
+    if not updated and delta > 0:
+        ProfileStats.rebuild(user_id)
+
+
+@receiver(post_save, sender=Post)
+def post_created(sender, instance, created, **kwargs):
+    if created:
+        change_stats(instance.author_id, 'post_count', 1)
+
+
+@receiver(post_delete, sender=Post)
+def post_deleted(sender, instance, **kwargs):
+    change_stats(instance.author_id, 'post_count', -1)
+
+
+@receiver(post_save, sender=Follow)
+def follow_created(sender, instance, created, **kwargs):
+    if created:
+        change_stats(instance.author_id, 'follower_count', 1)
+        change_stats(instance.user_id, 'following_count', 1)
+
+
+@receiver(post_delete, sender=Follow)
+def follow_deleted(sender, instance, **kwargs):
+    change_stats(instance.author_id, 'follower_count', -1)
+    change_stats(instance.user_id, 'following_count', -1)
+
+
+@receiver(post_save, sender=Post)
+def post_published(sender, instance, created, **kwargs):
+    '''Раскладывает публикацию по лентам подписчиков'''
+    if created:
+        timeline.fan_out(instance)
+    else:
+        TimelineEntry.objects.filter(post=instance).update(
+            pub_date=instance.pub_date)
+
+
+@receiver(post_save, sender=Follow)
+def follow_timeline(sender, instance, created, **kwargs):
+    if created:
+        timeline.backfill(instance.user_id, instance.author_id)
+
+
+@receiver(post_delete, sender=Follow)
+def unfollow_timeline(sender, instance, **kwargs):
+    timeline.prune(instance.user_id, instance.author_id)
+
+
+@receiver(pre_save, sender=Post)
+def remember_group(sender, instance, **kwargs):
+    '''Запоминает прежнюю группу, чтобы сбросить и ее ленту'''
+    instance._previous_group_id = None
+    if instance.pk is not None:
+        instance._previous_group_id = Post.objects.filter(
+            pk=instance.pk).values_list('group_id', flat=True).first()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def post_changed(sender, instance, **kwargs):
+    '''Сбрасывает кеш лент, в которых показывается публикация'''
+    scopes = feed_scopes(instance.pk, instance.author_id, instance.group_id)
+    previous_group_id = getattr(instance, '_previous_group_id', None)
+    if previous_group_id is not None:
+        scopes.append('group:{}'.format(previous_group_id))
+    bump_generations(scopes)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def comment_changed(sender, instance, **kwargs):
+    '''Сбрасывает кеш страницы публикации, а при добавлении и удалении
+    комментария - и лент, где показано их число'''
+    if instance.post_id in _deleting_posts():
+        return
+    scopes = ['post:{}'.format(instance.post_id)]
+    if kwargs.get('created', True):
+        post = Post.objects.filter(pk=instance.post_id).values_list(
+            'pk', 'author_id', 'group_id').first()
+        if post is not None:
+            scopes = feed_scopes(*post)
+    bump_generations(scopes)
+
+
+@receiver(post_save, sender=Follow)
+@receiver(post_delete, sender=Follow)
+def follow_changed(sender, instance, **kwargs):
+    '''Сбрасывает кеш профилей, где показано число подписок'''
+    bump_generations(['author:{}'.format(instance.author_id),
+                      'author:{}'.format(instance.user_id)])
+
+
+@receiver(post_save, sender=Group)
+def group_changed(sender, instance, **kwargs):
+    bump_generations(['all', 'group:{}'.format(instance.pk)])
+
+
+@receiver(post_save, sender=Post)
+def post_image_saved(sender, instance, **kwargs):
+    '''Создает миниатюры изображения вне обработки запроса'''
+    if instance.image:
+        schedule_thumbnails(instance.image.name, instance.pk)
+
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    search.index_document(search.POST, instance.pk, instance.pk,
+                          instance.text)
+
+
+@receiver(post_save, sender=Comment)
+def index_comment(sender, instance, **kwargs):
+    search.index_document(search.COMMENT, instance.pk, instance.post_id,
+                          instance.text)
+
+
+@receiver(post_delete, sender=Comment)
+def unindex_comment(sender, instance, **kwargs):
+    if instance.post_id in _deleting_posts():
+        return
+    search.remove_document(search.COMMENT, instance.pk)
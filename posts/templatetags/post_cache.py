@@ -0,0 +1,15 @@
+from django import template
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def post_card_key(context, post):
+    '''Ключ кеша карточки публикации: меняется при изменении публикации
+    и числа комментариев. Автор видит в карточке ссылки редактирования,
+    поэтому для него хранится отдельная копия'''
+    user = context.get('user')
+    owner = bool(user and user.is_authenticated
+                 and user.pk == post.author_id)
+    return '{}:{}:{}:{}'.format(post.pk, post.updated_at.timestamp(),
+                                post.comment_count, owner)
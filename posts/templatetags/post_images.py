@@ -0,0 +1,12 @@
+from django import template
+
+from posts import thumbnails
+
+register = template.Library()
+
+
+@register.inclusion_tag('post_image.html')
+def post_image(post):
+    '''Изображение публикации с вариантами WebP и разной ширины.
+    Миниатюры не создаются во время запроса'''
+    return thumbnails.card_image(post.image, post.pk)
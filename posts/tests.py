@@ -1,10 +1,45 @@
+import gzip
+import json
+import os
+import re
+import shutil
 import tempfile
+import time
+import zlib
+from io import BytesIO, StringIO
+from unittest import mock, skipUnless
 
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
 from django.core import mail
-from django.core.cache import cache
-from django.test import Client, TestCase, override_settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, router
+from django.http import Http404, HttpResponse
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.test import (Client, LiveServerTestCase, RequestFactory,
+                         SimpleTestCase, TestCase, TransactionTestCase,
+                         override_settings)
+from django.test.utils import CaptureQueriesContext
 
-from posts.models import Follow, Group, Post, User
+from PIL import Image
+
+from posts import thumbnails
+from posts.cache import get_generations
+from posts.management.commands.benchmark import capture_queries
+from posts.management.commands.import_yatube import Command as ImportCommand
+from posts.models import (Comment, Follow, Group, Post, ProfileStats,
+                          TimelineEntry, User)
+from posts.thumbnails import generate_thumbnails
+from users.models import Email
+from yatube import metrics
+from yatube.cache import TwoTierCache
+from yatube.db import STICKY_COOKIE, ReplicaMiddleware
+from yatube.media import serve_media
+from yatube.static import serve_static
 
 
 class SignUpTest(TestCase):
@@ -21,13 +56,51 @@ class SignUpTest(TestCase):
                                                       'password2': '*yxW$kE8'})
         self.assertRedirects(response, '/auth/login/')
         self.assertEqual(User.objects.count(), 1)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(Email.objects.count(), 1)
+        call_command('send_emails', stdout=StringIO())
         self.assertEqual(len(mail.outbox), 1)
         self.assertEqual(
             mail.outbox[0].subject, 'Подтверждение регистрации Yatube')
+        self.assertEqual(mail.outbox[0].to, ['test@user.com'])
         response = self.client.get('/testUser/')
         self.assertEqual(response.status_code, 200)
 
 
+class OutboxTest(TestCase):
+    '''Тестирование очереди писем'''
+    def setUp(self):
+        for i in range(3):
+            Email.enqueue('Тема', 'Текст', 'admin@yatube.ru',
+                          ['user{}@yatube.ru'.format(i)])
+
+    def test_batches_over_one_connection(self):
+        with mock.patch('django.core.mail.get_connection',
+                        wraps=mail.get_connection) as get_connection:
+            call_command('send_emails', batch_size=2, stdout=StringIO())
+            self.assertEqual(len(mail.outbox), 2)
+            self.assertEqual(get_connection.call_count, 1)
+        call_command('send_emails', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertFalse(Email.objects.filter(sent_at__isnull=True).exists())
+        call_command('send_emails', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_retry_with_backoff(self):
+        with mock.patch('django.core.mail.EmailMessage.send',
+                        side_effect=OSError('SMTP недоступен')):
+            call_command('send_emails', stdout=StringIO())
+        email = Email.objects.first()
+        self.assertEqual(email.attempts, 1)
+        self.assertEqual(email.last_error, 'SMTP недоступен')
+        self.assertGreater(email.send_after, timezone.now())
+        call_command('send_emails', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 0)
+        Email.objects.update(send_after=timezone.now())
+        call_command('send_emails', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 3)
+
+
 @override_settings(CACHES={
     'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
 class PostsTest(TestCase):
@@ -132,15 +205,41 @@ class CacheTest(TestCase):
         self.client.login(username="testUser", password="*yxW$kE8")
         Post.objects.create(text='A test post', author=self.user)
 
+    def tearDown(self):
+        cache.clear()
+
     def test_index_cache(self):
         response = self.client.get('/')
         self.assertContains(response, 'A test post', status_code=200)
-        self.client.post('/new/', {'text': 'A test post 2'})
+        Post.objects.update(text='A changed post')
         response = self.client.get('/')
-        self.assertNotContains(response, 'A test post 2', status_code=200)
+        self.assertNotContains(response, 'A changed post', status_code=200)
         cache.clear()
         response = self.client.get('/')
+        self.assertContains(response, 'A changed post', status_code=200)
+
+    def test_cache_invalidation(self):
+        self.client.get('/')
+        self.client.get('/testUser/')
+        self.client.post('/new/', {'text': 'A test post 2'})
+        response = self.client.get('/')
         self.assertContains(response, 'A test post 2', status_code=200)
+        response = self.client.get('/testUser/')
+        self.assertContains(response, 'A test post 2', status_code=200)
+        self.client.post('/testUser/1/comment/', {'text': 'A test comment'})
+        response = self.client.get('/')
+        self.assertContains(response, '1 комментарий', status_code=200)
+
+    def test_shared_between_viewers(self):
+        Client().get('/')
+        Post.objects.update(text='A changed post')
+        User.objects.create_user(username="testUser2", password="*yxW$kE82")
+        reader = Client()
+        reader.login(username="testUser2", password="*yxW$kE82")
+        response = reader.get('/')
+        self.assertNotContains(response, 'A changed post', status_code=200)
+        response = self.client.get('/')
+        self.assertContains(response, 'Редактировать', status_code=200)
 
 
 class FollowTest(TestCase):
@@ -175,6 +274,24 @@ class FollowTest(TestCase):
             user=self.user1, author=self.user2).first()
         self.assertIsNone(follower)
 
+    def test_follow_twice(self):
+        self.client.login(username="testUser1", password="*yxW$kE81")
+        self.client.get('/testUser2/follow')
+        self.client.get('/testUser2/follow')
+        self.assertEqual(Follow.objects.filter(user=self.user1).count(), 1)
+        self.assertEqual(self.user2.stats.follower_count, 1)
+
+    def test_following_flag(self):
+        self.client.force_login(self.user1)
+        response = self.client.get('/testUser2/')
+        self.assertFalse(response.context['following'])
+        Follow.objects.create(user=self.user1, author=self.user2)
+        post = Post.objects.create(author=self.user2, text='A test post')
+        response = self.client.get('/testUser2/')
+        self.assertTrue(response.context['following'])
+        response = self.client.get('/testUser2/{}/'.format(post.pk))
+        self.assertTrue(response.context['following'])
+
     def test_follow_posts(self):
         self.client.login(username="testUser1", password="*yxW$kE81")
         self.client.get('/testUser2/follow')
@@ -207,3 +324,1040 @@ class CommentsTest(TestCase):
         self.assertRedirects(response, '/testUser1/1/')
         response = self.client.get('/testUser1/1/')
         self.assertContains(response, 'A test comment', status_code=200)
+
+    def test_comment_pages(self):
+        post = Post.objects.get(pk=1)
+        for i in range(25):
+            Comment.objects.create(post=post, author=self.user1,
+                                   text='Comment {}'.format(i))
+        response = self.client.get('/testUser1/1/')
+        comments = response.context['comments']
+        self.assertEqual(len(comments), 20)
+        self.assertEqual(comments[0].text, 'Comment 24')
+        self.assertContains(response, 'Комментарии: 25')
+        response = self.client.get('/testUser1/1/comments/',
+                                   {'after': comments.next_cursor})
+        self.assertContains(response, 'Comment 4 </p>')
+        self.assertNotContains(response, 'Comment 5 </p>')
+        self.assertNotContains(response, 'js-more-comments')
+        self.assertNotContains(response, '<html>')
+        response = self.client.get('/testUser1/1/', {
+            'comments_after': comments.next_cursor})
+        self.assertEqual(len(response.context['comments']), 5)
+        response = self.client.get('/testUser2/1/comments/')
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get('/testUser1/999/comments/')
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class PaginatorTest(TestCase):
+    '''Тестирование постраничного вывода по курсору'''
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(username="testUser",
+                                             email="test@user.com",
+                                             password="*yxW$kE8")
+        for i in range(25):
+            Post.objects.create(text='Post {}'.format(i), author=self.user)
+
+    def test_cursor_pages(self):
+        response = self.client.get('/')
+        page = response.context["page"]
+        self.assertEqual([post.text for post in page],
+                         ['Post {}'.format(i) for i in range(24, 14, -1)])
+        self.assertFalse(page.has_previous())
+        response = self.client.get('/?after={}'.format(page.next_cursor))
+        page = response.context["page"]
+        self.assertEqual(page[0].text, 'Post 14')
+        response = self.client.get('/?after={}'.format(page.next_cursor))
+        page = response.context["page"]
+        self.assertEqual(len(page), 5)
+        self.assertFalse(page.has_next())
+        response = self.client.get(
+            '/?before={}'.format(page.previous_cursor))
+        page = response.context["page"]
+        self.assertEqual(page[0].text, 'Post 14')
+        self.assertTrue(page.has_previous())
+
+    def test_legacy_page_number(self):
+        response = self.client.get('/testUser/?page=3')
+        self.assertEqual(response.context["page"].number, 3)
+        self.assertEqual(response.context["page"][0].text, 'Post 4')
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/?after=garbage')
+        self.assertEqual(response.context["page"][0].text, 'Post 24')
+
+
+class CommentCountTest(TestCase):
+    '''Тестирование сохраненного счетчика комментариев'''
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(username="testUser",
+                                             email="test@user.com",
+                                             password="*yxW$kE8")
+        self.post = Post.objects.create(author=self.user, text='A test post')
+        self.client.login(username="testUser", password="*yxW$kE8")
+
+    def test_comment_count(self):
+        self.client.post('/testUser/1/comment/', {'text': 'Comment 1'})
+        self.client.post('/testUser/1/comment/', {'text': 'Comment 2'})
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 2)
+        self.client.get('/testUser/1/1/comment-delete/')
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+        Comment.objects.all().delete()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 0)
+
+    @override_settings(CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_post_delete_cascade(self):
+        other = Post.objects.create(author=self.user, text='Other post')
+        Comment.objects.create(post=other, author=self.user, text='Кот')
+        for number in range(50):
+            Comment.objects.create(post=self.post, author=self.user,
+                                   text='Кот {}'.format(number))
+        with CaptureQueriesContext(connection) as queries:
+            self.post.delete()
+        self.assertLess(len(queries), 10)
+        other.refresh_from_db()
+        self.assertEqual(other.comment_count, 1)
+        response = self.client.get('/search/', {'q': 'кот'})
+        self.assertEqual(list(response.context['page']), [other])
+        Comment.objects.get().delete()
+        other.refresh_from_db()
+        self.assertEqual(other.comment_count, 0)
+
+    def test_rebuild_comment_counts(self):
+        Comment.objects.create(post=self.post, author=self.user, text='1')
+        Post.objects.update(comment_count=10)
+        call_command('rebuild_comment_counts', stdout=StringIO())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class ProfileStatsTest(TestCase):
+    '''Тестирование статистики профиля'''
+    def setUp(self):
+        self.client = Client()
+        self.user1 = User.objects.create_user(username="testUser1",
+                                              password="*yxW$kE81")
+        self.user2 = User.objects.create_user(username="testUser2",
+                                              password="*yxW$kE82")
+        self.client.login(username="testUser1", password="*yxW$kE81")
+
+    def test_stats_maintained(self):
+        self.client.post('/new/', {'text': 'A test post'})
+        self.client.get('/testUser2/follow')
+        response = self.client.get('/testUser2/')
+        self.assertEqual(response.context["stats"].follower_count, 1)
+        response = self.client.get('/testUser1/')
+        stats = response.context["stats"]
+        self.assertEqual((stats.following_count, stats.post_count), (1, 1))
+        self.client.get('/testUser2/unfollow')
+        self.client.get('/testUser1/1/delete/')
+        stats = ProfileStats.objects.get(user=self.user1)
+        self.assertEqual((stats.following_count, stats.post_count), (0, 0))
+        self.assertEqual(self.user2.stats.follower_count, 0)
+
+    def test_rebuild_profile_stats(self):
+        Post.objects.create(author=self.user2, text='A test post')
+        Follow.objects.create(user=self.user1, author=self.user2)
+        ProfileStats.objects.update(post_count=5, follower_count=5)
+        call_command('rebuild_profile_stats', stdout=StringIO())
+        stats = ProfileStats.objects.get(user=self.user2)
+        self.assertEqual((stats.follower_count, stats.post_count), (1, 1))
+
+    def test_rebuild_profile_stats_keeps_rows(self):
+        ProfileStats.objects.filter(user=self.user1).delete()
+        Follow.objects.create(user=self.user1, author=self.user2)
+        call_command('rebuild_profile_stats', stdout=StringIO())
+        stats = ProfileStats.objects.get(user=self.user1)
+        self.assertEqual(stats.following_count, 1)
+        self.assertEqual(self.user2.stats.follower_count, 1)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class TimelineTest(TestCase):
+    '''Тестирование ленты подписок'''
+    def setUp(self):
+        self.client = Client()
+        self.user1 = User.objects.create_user(username="testUser1",
+                                              password="*yxW$kE81")
+        self.user2 = User.objects.create_user(username="testUser2",
+                                              password="*yxW$kE82")
+        self.client.login(username="testUser1", password="*yxW$kE81")
+
+    def test_fan_out_and_backfill(self):
+        Post.objects.create(author=self.user2, text='Old post')
+        self.client.get('/testUser2/follow')
+        Post.objects.create(author=self.user2, text='New post')
+        self.assertEqual(
+            TimelineEntry.objects.filter(follower=self.user1).count(), 2)
+        response = self.client.get('/follow/')
+        self.assertEqual([post.text for post in response.context["page"]],
+                         ['New post', 'Old post'])
+        self.client.get('/testUser2/unfollow')
+        self.assertFalse(TimelineEntry.objects.exists())
+
+    def test_follow_feed_pages(self):
+        user3 = User.objects.create_user(username="testUser3")
+        Follow.objects.create(user=user3, author=self.user2)
+        self.client.get('/testUser2/follow')
+        for i in range(12):
+            Post.objects.create(author=self.user2, text='Post {}'.format(i))
+        response = self.client.get('/follow/')
+        page = response.context["page"]
+        self.assertEqual(len(page), 10)
+        response = self.client.get('/follow/?after={}'.format(
+            page.next_cursor))
+        self.assertEqual([post.text for post in response.context["page"]],
+                         ['Post 1', 'Post 0'])
+
+    @override_settings(TIMELINE_FANOUT_LIMIT=0)
+    def test_fan_in_for_popular_authors(self):
+        self.client.get('/testUser2/follow')
+        Post.objects.create(author=self.user2, text='A test post')
+        self.assertFalse(TimelineEntry.objects.exists())
+        response = self.client.get('/follow/')
+        self.assertContains(response, 'A test post', status_code=200)
+
+    @override_settings(TIMELINE_FANOUT_LIMIT=1)
+    def test_fan_in_after_author_loses_followers(self):
+        user3 = User.objects.create_user(username="testUser3")
+        Follow.objects.create(user=user3, author=self.user2)
+        self.client.get('/testUser2/follow')
+        Post.objects.create(author=self.user2, text='While popular')
+        Follow.objects.filter(user=user3).delete()
+        Post.objects.create(author=self.user2, text='After')
+        response = self.client.get('/follow/')
+        self.assertEqual([post.text for post in response.context["page"]],
+                         ['After', 'While popular'])
+
+    def test_rebuild_timelines(self):
+        Follow.objects.create(user=self.user1, author=self.user2)
+        Post.objects.create(author=self.user2, text='A test post')
+        TimelineEntry.objects.all().delete()
+        call_command('rebuild_timelines', stdout=StringIO())
+        self.assertEqual(TimelineEntry.objects.count(), 1)
+
+
+class AnonymousPageCacheTest(TestCase):
+    '''Тестирование кеширования страниц для неавторизованных посетителей'''
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(username="testUser",
+                                             password="*yxW$kE8")
+        Post.objects.create(text='A test post', author=self.user)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_conditional_response(self):
+        response = self.client.get('/testUser/1/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('public', response['Cache-Control'])
+        self.assertIn('Cookie', response['Vary'])
+        etag = response['ETag']
+        response = self.client.get('/testUser/1/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get(
+            '/testUser/1/',
+            HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+        Comment.objects.create(post_id=1, author=self.user, text='A comment')
+        response = self.client.get('/testUser/1/', HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(response, 'A comment', status_code=200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_page_cache(self):
+        self.client.get('/')
+        Post.objects.update(text='A changed post')
+        response = self.client.get('/')
+        self.assertNotContains(response, 'A changed post', status_code=200)
+        Post.objects.create(text='A new post', author=self.user)
+        response = self.client.get('/')
+        self.assertContains(response, 'A new post', status_code=200)
+
+    def test_authenticated_not_cached(self):
+        self.client.login(username="testUser", password="*yxW$kE8")
+        response = self.client.get('/')
+        self.assertIn('private', response['Cache-Control'])
+        self.assertFalse(response.has_header('ETag'))
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+               'LOCATION': 'two-tier-test'}})
+class TwoTierCacheTest(TestCase):
+    '''Тестирование двухуровневого кеша на двух "воркерах"'''
+    def setUp(self):
+        params = {'OPTIONS': {'SHARED': 'shared', 'MAX_ENTRIES': 2,
+                              'SYNC_INTERVAL': 0,
+                              'IMMUTABLE_PREFIXES': ('page:',)}}
+        self.worker1 = TwoTierCache(self.id() + '1', params)
+        self.worker2 = TwoTierCache(self.id() + '2', params)
+        self.worker1.clear()
+
+    def test_invalidation_reaches_other_worker(self):
+        self.worker1.set('key', 'value 1')
+        self.assertEqual(self.worker2.get('key'), 'value 1')
+        self.assertEqual(self.worker2.get('key'), 'value 1')
+        self.assertEqual(self.worker2.stats()['local']['hits'], 1)
+        self.worker1.set('key', 'value 2')
+        self.assertEqual(self.worker2.get('key'), 'value 2')
+        self.worker1.delete('key')
+        self.assertIsNone(self.worker2.get('key'))
+
+    def test_journal_writes(self):
+        sequence = self.worker1.current_sequence()
+        self.worker1.set('page:1', 'content')
+        self.assertEqual(self.worker1.current_sequence(), sequence)
+        self.assertEqual(self.worker2.get('page:1'), 'content')
+        self.worker1.set('key', 'old')
+        self.assertEqual(self.worker2.get('key'), 'old')
+        sequence = self.worker1.current_sequence()
+        self.worker1.set_many({'key': 'value', 'other': 'value'})
+        self.assertEqual(self.worker1.current_sequence(), sequence + 1)
+        self.assertEqual(self.worker2.get('key'), 'value')
+        self.worker1.delete_many(['key', 'other'])
+        self.assertIsNone(self.worker2.get('other'))
+
+    def test_sequence_survives_shared_cache_loss(self):
+        self.worker1.set('key', 'old')
+        self.assertEqual(self.worker2.get('key'), 'old')
+        sequence = self.worker1.current_sequence()
+        caches['shared'].clear()
+        self.worker1.set('key', 'new')
+        self.assertEqual(self.worker1.current_sequence(), sequence + 1)
+        self.assertEqual(self.worker2.get('key'), 'new')
+
+    def test_lru_eviction(self):
+        for key in ('a', 'b', 'c'):
+            self.worker1.set(key, key)
+        stats = self.worker1.stats()['local']
+        self.assertEqual((stats['size'], stats['evictions']), (2, 1))
+        self.assertEqual(self.worker1.get('a'), 'a')
+        self.assertEqual(self.worker1.stats()['shared']['hits'], 1)
+
+
+def make_image(name='test.jpg', size=(1200, 800)):
+    buffer = BytesIO()
+    Image.new('RGB', size, 'blue').save(buffer, 'JPEG')
+    return SimpleUploadedFile(name, buffer.getvalue(),
+                              content_type='image/jpeg')
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+                   MEDIA_ROOT=tempfile.mkdtemp())
+class ThumbnailTest(TestCase):
+    '''Тестирование предварительного создания миниатюр'''
+    def setUp(self):
+        self.client = Client()
+        user = User.objects.create_user(username="testUser")
+        self.post = Post.objects.create(author=user, text='A test post',
+                                        image=make_image())
+
+    def test_template_uses_pregenerated_thumbnail(self):
+        response = self.client.get('/')
+        self.assertContains(response, 'src="/media/posts/test', count=1)
+        generate_thumbnails(self.post.image.name)
+        response = self.client.get('/')
+        self.assertContains(response, 'src="/media/cache/', count=1)
+        self.assertContains(response, '<source type="image/webp"', count=1)
+        self.assertContains(response, ' 480w, ', count=2)
+
+    def test_missing_thumbnails_scheduled_for_post(self):
+        with mock.patch('posts.thumbnails.schedule_thumbnails') as schedule:
+            self.client.get('/')
+        schedule.assert_called_with(self.post.image.name, self.post.pk)
+
+    def test_upload_normalized(self):
+        self.client.force_login(self.post.author)
+        image = Image.new('RGB', (3000, 2000), 'red')
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        exif[0x010f] = 'Camera'
+        buffer = BytesIO()
+        image.save(buffer, 'JPEG', exif=exif)
+        upload = SimpleUploadedFile('photo.jpeg', buffer.getvalue(),
+                                    content_type='image/jpeg')
+        self.client.post('/new/', {'text': 'Photo', 'image': upload})
+        post = Post.objects.get(text='Photo')
+        self.assertTrue(post.image.name.endswith('.jpg'))
+        with Image.open(post.image.path) as stored:
+            self.assertEqual(stored.size, (1280, 1920))
+            self.assertFalse(stored.getexif())
+
+    @override_settings(POST_IMAGE_MAX_SIZE=1024)
+    def test_upload_too_large(self):
+        self.client.force_login(self.post.author)
+        response = self.client.post(
+            '/new/', {'text': 'Photo', 'image': make_image()})
+        self.assertFormError(response, 'form', 'image',
+                             'Размер изображения не должен превышать '
+                             '1,0\xa0КБ')
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class SearchTest(TestCase):
+    '''Тестирование полнотекстового поиска'''
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(username="testUser")
+        self.post1 = Post.objects.create(author=self.user,
+                                         text='Прогулка по лесу')
+        self.post2 = Post.objects.create(author=self.user,
+                                         text='Рецепт пирога')
+
+    def search(self, query, **params):
+        response = self.client.get('/search/', dict(q=query, **params))
+        return response, [post.text for post in response.context["page"]]
+
+    def test_search_posts_and_comments(self):
+        Comment.objects.create(post=self.post2, author=self.user,
+                               text='Пирог получился в лесу у костра')
+        _, found = self.search('лес')
+        self.assertEqual(sorted(found), ['Прогулка по лесу', 'Рецепт пирога'])
+        _, found = self.search('пирог')
+        self.assertEqual(found, ['Рецепт пирога'])
+
+    def test_index_updated(self):
+        self.post1.text = 'Прогулка по полю'
+        self.post1.save()
+        self.assertEqual(self.search('лесу')[1], [])
+        self.post2.delete()
+        self.assertEqual(self.search('пирога')[1], [])
+        self.assertEqual(self.search('"(*')[1], [])
+
+    def test_search_pages(self):
+        for i in range(12):
+            Post.objects.create(author=self.user,
+                                text='Кот номер {}'.format(i))
+        response, found = self.search('кот')
+        self.assertEqual(len(found), 10)
+        _, rest = self.search(
+            'кот', after=response.context["page"].next_cursor)
+        self.assertEqual(len(rest), 2)
+        self.assertFalse(set(found) & set(rest))
+
+    def test_search_pages_with_tied_scores(self):
+        posts = {Post.objects.create(author=self.user, text='Кот').pk
+                 for _ in range(25)}
+        found, cursor = [], None
+        while True:
+            response = self.client.get(
+                '/search/', {'q': 'кот', 'after': cursor or ''})
+            page = response.context["page"]
+            found += [post.pk for post in page]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(len(found), 25)
+        self.assertEqual(set(found), posts)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class AdminTest(TestCase):
+    '''Тестирование списков админки'''
+    def setUp(self):
+        self.client = Client()
+        self.admin = User.objects.create_superuser(
+            username="admin", email="admin@user.com", password="*yxW$kE8")
+        self.client.force_login(self.admin)
+
+    def create_rows(self, count):
+        start = User.objects.count()
+        for i in range(start, start + count):
+            user = User.objects.create_user(username='user{}'.format(i))
+            post = Post.objects.create(author=user,
+                                       text='Post {}'.format(i))
+            Comment.objects.create(post=post, author=user, text='Comment')
+            Follow.objects.create(user=user, author=self.admin)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_constant_query_count(self):
+        urls = ('/admin/posts/post/', '/admin/posts/comment/',
+                '/admin/posts/follow/')
+        self.create_rows(2)
+        small = [self.count_queries(url) for url in urls]
+        self.create_rows(8)
+        self.assertEqual([self.count_queries(url) for url in urls], small)
+
+    def test_full_text_search(self):
+        self.create_rows(3)
+        response = self.client.get('/admin/posts/post/', {'q': 'Post'})
+        self.assertEqual(response.context['cl'].result_count, 3)
+        response = self.client.get('/admin/posts/comment/', {'q': 'Post'})
+        self.assertEqual(response.context['cl'].result_count, 0)
+        for url in ('/admin/posts/post/1/change/',
+                    '/admin/posts/comment/1/change/',
+                    '/admin/posts/follow/1/change/'):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_comment_post_readonly_on_change(self):
+        self.create_rows(2)
+        comment = Comment.objects.first()
+        other = Post.objects.exclude(pk=comment.post_id).first()
+        self.client.post('/admin/posts/comment/{}/change/'.format(
+            comment.pk), {'post': other.pk, 'author': comment.author_id,
+                          'text': 'Moved'})
+        comment.refresh_from_db()
+        self.assertEqual(comment.text, 'Moved')
+        self.assertNotEqual(comment.post_id, other.pk)
+        other.refresh_from_db()
+        self.assertEqual(other.comment_count, 1)
+
+
+class TransferTest(TestCase):
+    '''Тестирование выгрузки и загрузки данных'''
+    def setUp(self):
+        self.author = User.objects.create_user(username="author")
+        self.reader = User.objects.create_user(username="reader")
+        self.group = Group.objects.create(title="Группа", slug="group")
+        self.post = Post.objects.create(author=self.author, group=self.group,
+                                        text="Перенесенная публикация")
+        Post.objects.filter(pk=self.post.pk).update(
+            pub_date="2019-01-01T10:00:00Z",
+            updated_at="2019-01-02T10:00:00Z")
+        Comment.objects.create(post=self.post, author=self.reader,
+                               text="Комментарий")
+        Follow.objects.create(user=self.reader, author=self.author)
+        self.dump = tempfile.NamedTemporaryFile(suffix='.jsonl').name
+        call_command('export_yatube', output=self.dump, stderr=StringIO())
+        User.objects.all().delete()
+        Group.objects.all().delete()
+
+    def test_round_trip(self):
+        call_command('import_yatube', self.dump, stdout=StringIO())
+        post = Post.objects.get(pk=self.post.pk)
+        self.assertEqual(post.pub_date.year, 2019)
+        self.assertEqual(post.updated_at.day, 2)
+        self.assertEqual(post.group.slug, "group")
+        self.assertEqual(post.comment_count, 1)
+        self.assertEqual(post.author.stats.follower_count, 1)
+        self.assertTrue(TimelineEntry.objects.filter(
+            follower__username="reader", post=post).exists())
+        self.assertEqual(User.objects.create_user("new").pk,
+                         self.reader.pk + 1)
+
+    def test_resume(self):
+        flush = ImportCommand.flush
+
+        def interrupted(command, model, batch, line_number):
+            if model is Post:
+                raise KeyboardInterrupt
+            flush(command, model, batch, line_number)
+
+        with mock.patch.object(ImportCommand, 'flush', interrupted):
+            with self.assertRaises(KeyboardInterrupt):
+                call_command('import_yatube', self.dump, batch_size=1,
+                             stdout=StringIO())
+        self.assertEqual(User.objects.count(), 2)
+        self.assertFalse(Post.objects.exists())
+        with open(self.dump + '.progress') as progress:
+            self.assertEqual(progress.read(), '3')
+        call_command('import_yatube', self.dump, stdout=StringIO())
+        self.assertEqual(User.objects.count(), 2)
+        self.assertEqual(Post.objects.count(), 1)
+        self.assertEqual(Comment.objects.count(), 1)
+        self.assertFalse(os.path.exists(self.dump + '.progress'))
+
+
+class ApiTest(TestCase):
+    '''Тестирование JSON API'''
+    def setUp(self):
+        self.client = Client()
+        self.author = User.objects.create_user(username="author")
+        self.reader = User.objects.create_user(username="reader")
+        self.group = Group.objects.create(title="Группа", slug="group")
+        self.posts = [Post.objects.create(author=self.author,
+                                          group=self.group,
+                                          text="Текст {}".format(i))
+                      for i in range(25)]
+
+    def test_posts_cursor_and_fields(self):
+        response = self.client.get("/api/v1/posts/",
+                                   {'fields': 'text,author', 'limit': 20})
+        data = response.json()
+        self.assertEqual(len(data['results']), 20)
+        self.assertEqual(data['results'][0],
+                         {'text': 'Текст 24', 'author': 'author'})
+        self.assertIsNone(data['previous'])
+        data = self.client.get("/api/v1/posts/",
+                               {'after': data['next']}).json()
+        self.assertEqual([post['id'] for post in data['results']],
+                         [post.pk for post in self.posts[4::-1]])
+        self.assertIsNone(data['next'])
+        self.assertEqual(data['results'][0]['group'], 'group')
+
+    def test_unknown_field(self):
+        response = self.client.get("/api/v1/posts/", {'fields': 'password'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_comments_and_groups(self):
+        post = self.posts[0]
+        Comment.objects.create(post=post, author=self.reader, text="Ответ")
+        data = self.client.get(
+            "/api/v1/posts/{}/comments/".format(post.pk)).json()
+        self.assertEqual(data['results'][0]['author'], 'reader')
+        data = self.client.get("/api/v1/groups/").json()
+        self.assertEqual(data['results'][0]['slug'], 'group')
+        data = self.client.get("/api/v1/posts/{}/".format(post.pk)).json()
+        self.assertEqual(data['comment_count'], 1)
+
+    def test_follow_feed(self):
+        response = self.client.get("/api/v1/follow/")
+        self.assertEqual(response.status_code, 401)
+        Follow.objects.create(user=self.reader, author=self.author)
+        self.client.force_login(self.reader)
+        with self.assertNumQueries(4):
+            data = self.client.get("/api/v1/follow/").json()
+        self.assertEqual(data['results'][0]['id'], self.posts[-1].pk)
+        self.assertEqual(len(data['results']), 20)
+
+
+@override_settings(REPLICA_DATABASES=['replica'])
+class ReplicaRouterTest(SimpleTestCase):
+    '''Тестирование маршрутизации чтения на реплики'''
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def route(self, request, write=False):
+        def view(request):
+            if write:
+                router.db_for_write(Post)
+            response = HttpResponse()
+            response.db = router.db_for_read(Post)
+            return response
+        return ReplicaMiddleware(view)(request)
+
+    def test_safe_requests_read_replica(self):
+        response = self.route(self.factory.get('/'))
+        self.assertEqual(response.db, 'replica')
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+        self.assertEqual(router.db_for_read(Post), 'default')
+        response = self.route(self.factory.post('/new/'))
+        self.assertEqual(response.db, 'default')
+
+    def test_read_your_writes(self):
+        response = self.route(self.factory.get('/author/follow'),
+                              write=True)
+        self.assertEqual(response.db, 'default')
+        self.assertIn(STICKY_COOKIE, response.cookies)
+        request = self.factory.get('/')
+        request.COOKIES[STICKY_COOKIE] = '1'
+        self.assertEqual(self.route(request).db, 'default')
+
+    def test_cache_writes_do_not_stick(self):
+        def view(request):
+            router.db_for_write(caches['shared'].cache_model_class)
+            response = HttpResponse()
+            response.db = router.db_for_read(Post)
+            return response
+        response = ReplicaMiddleware(view)(self.factory.get('/'))
+        self.assertEqual(response.db, 'replica')
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+
+class MetricsTest(TestCase):
+    '''Тестирование метрик представлений'''
+    def setUp(self):
+        metrics._views.clear()
+        self.client = Client()
+        self.admin = User.objects.create_superuser(
+            username="admin", email="admin@user.com", password="*yxW$kE8")
+
+    def test_protected(self):
+        self.assertEqual(self.client.get('/metrics/').status_code, 403)
+        with override_settings(METRICS_TOKEN='secret'):
+            response = self.client.get('/metrics/',
+                                       HTTP_AUTHORIZATION='Bearer secret')
+            self.assertEqual(response.status_code, 200)
+            response = self.client.get('/metrics/',
+                                       HTTP_AUTHORIZATION='Bearer wrong')
+            self.assertEqual(response.status_code, 403)
+
+    def test_per_view_metrics(self):
+        self.client.get('/')
+        self.client.get('/')
+        metrics_cache = caches[settings.METRICS_CACHE]
+        metrics_cache.set(metrics.WORKER_KEY.format('other:1'), {
+            'index': {'buckets': [1] + [0] * len(metrics.LATENCY_BUCKETS),
+                      'count': 1, 'sum': 0.001, 'queries': 3,
+                      'sql_time': 0.0005}})
+        metrics_cache.set(metrics.WORKERS_KEY, {'other:1'})
+        # Сброс кеша страниц не трогает снимки воркеров
+        cache.clear()
+        self.client.force_login(self.admin)
+        text = self.client.get('/metrics/').content.decode()
+        self.assertIn('yatube_request_duration_seconds_count'
+                      '{view="index"} 3', text)
+        self.assertIn('yatube_request_duration_seconds_bucket'
+                      '{view="index",le="+Inf"} 3', text)
+        queries = re.search(
+            r'yatube_sql_queries_total\{view="index"\} (\d+)', text)
+        self.assertGreater(int(queries.group(1)), 3)
+
+
+class BenchmarkTest(TransactionTestCase):
+    '''Тестирование команды замера производительности. GET-запросы
+    читают реплики через другое соединение, поэтому данные фиксируются'''
+    databases = '__all__'
+
+    def test_report_and_baseline(self):
+        output = tempfile.NamedTemporaryFile(suffix='.json').name
+        call_command('benchmark', current_db=True, scale=0.02, requests=2,
+                     output=output, stderr=StringIO())
+        with open(output) as report:
+            results = json.load(report)
+        self.assertEqual(results['index:anonymous']['status'], 200)
+        self.assertIn('p99_ms', results['post:authenticated'])
+        self.assertNotIn('post_delete:authenticated', results)
+        for result in results.values():
+            result['p95_ms'] = 0
+        with open(output, 'w') as baseline:
+            json.dump(results, baseline)
+        with self.assertRaises(CommandError):
+            call_command('benchmark', current_db=True, requests=2,
+                         baseline=output, output=output, stderr=StringIO())
+
+    @skipUnless(settings.REPLICA_DATABASES, 'Реплики не настроены')
+    def test_replica_queries_counted(self):
+        user = User.objects.create_user(username="reader")
+        Post.objects.create(author=user, text='A test post')
+        client = Client()
+        client.force_login(user)
+        with capture_queries() as queries:
+            client.get('/')
+        counts = {captured.connection.alias: len(captured)
+                  for captured in queries}
+        self.assertGreater(counts[settings.REPLICA_DATABASES[0]], 0)
+
+
+class BenchmarkServersTest(LiveServerTestCase):
+    '''Тестирование нагрузки сервера медленными клиентами'''
+    def test_load_running_server(self):
+        author = User.objects.create_user(username="author")
+        Post.objects.create(author=author, text='A test post')
+        Group.objects.create(title='Group', slug='group',
+                             description='Group')
+        output = tempfile.NamedTemporaryFile(suffix='.json').name
+        call_command('benchmark_servers', url=self.live_server_url,
+                     concurrency=2, requests=3, send_delay=0.01,
+                     output=output)
+        with open(output) as report:
+            result = json.load(report)[self.live_server_url]
+        self.assertEqual((result['requests'], result['errors']), (6, 0))
+        self.assertIn('p95_ms', result)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'post-cards'}})
+class PostCardCacheTest(TestCase):
+    '''Тестирование кеша карточек публикаций'''
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(username="testUser",
+                                             password="*yxW$kE8")
+        self.post = Post.objects.create(author=self.user, text='Original')
+
+    def render(self):
+        self.post.refresh_from_db()
+        return render_to_string('post_item.html', {'post': self.post})
+
+    def test_card_keyed_on_version(self):
+        self.assertIn('Original', self.render())
+        Post.objects.filter(pk=self.post.pk).update(text='Silent change')
+        self.assertIn('Original', self.render())
+        Comment.objects.create(post=self.post, author=self.user, text='Hi')
+        self.assertIn('Silent change', self.render())
+        self.post.text = 'Edited'
+        self.post.save()
+        self.assertIn('Edited', self.render())
+
+    def test_edit_keeps_pub_date(self):
+        pub_date = self.post.pub_date
+        self.client.force_login(self.user)
+        self.client.post('/testUser/{}/edit/'.format(self.post.pk),
+                         {'text': 'Edited'})
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.text, 'Edited')
+        self.assertEqual(self.post.pub_date, pub_date)
+        self.assertGreater(self.post.updated_at, pub_date)
+
+    @mock.patch('posts.thumbnails.connection')
+    @mock.patch('posts.thumbnails.generate_thumbnails')
+    def test_thumbnails_reset_feeds(self, generate, connection):
+        scopes = ['all', 'author:{}'.format(self.user.pk)]
+        before = get_generations(scopes)
+        updated_at = self.post.updated_at
+        thumbnails._generate_in_background('posts/image.jpg', self.post.pk)
+        generate.assert_called_once_with('posts/image.jpg')
+        self.post.refresh_from_db()
+        self.assertGreater(self.post.updated_at, updated_at)
+        for old, new in zip(before, get_generations(scopes)):
+            self.assertGreater(new, old)
+
+
+class StaticFilesTest(TestCase):
+    '''Тестирование сборки и раздачи статики'''
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.static_root = tempfile.mkdtemp()
+        cls.settings_override = override_settings(STATIC_ROOT=cls.static_root)
+        cls.settings_override.enable()
+        call_command('collectstatic', interactive=False, verbosity=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        shutil.rmtree(cls.static_root)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.name = staticfiles_storage.stored_name(
+            'bootstrap/dist/css/bootstrap.min.css')
+
+    def test_hashed_names_in_templates(self):
+        self.assertRegex(self.name, r'bootstrap\.min\.[0-9a-f]{12}\.css$')
+        response = self.client.get('/')
+        self.assertContains(response, '/static/' + self.name)
+        self.assertTrue(staticfiles_storage.exists(self.name + '.gz'))
+
+    def test_serve_precompressed(self):
+        request = self.factory.get('/static/' + self.name,
+                                   HTTP_ACCEPT_ENCODING='gzip, deflate')
+        response = serve_static(request, self.name)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('Accept-Encoding', response['Vary'])
+        body = gzip.decompress(b''.join(response.streaming_content))
+        with staticfiles_storage.open(self.name) as original:
+            self.assertEqual(body, original.read())
+        request = self.factory.get('/static/bootstrap/dist/css/'
+                                   'bootstrap.min.css')
+        response = serve_static(request, 'bootstrap/dist/css/'
+                                         'bootstrap.min.css')
+        self.assertNotIn('Content-Encoding', response)
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        response.close()
+        with self.assertRaises(Http404):
+            serve_static(request, '../yatube/settings.py')
+
+
+class MediaTest(TestCase):
+    '''Тестирование раздачи загруженных файлов'''
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        os.makedirs(os.path.join(self.media_root, 'posts'))
+        self.content = bytes(range(256)) * 4
+        with open(os.path.join(self.media_root, 'posts', 'image.jpg'),
+                  'wb') as image:
+            image.write(self.content)
+        with open(os.path.join(self.media_root, 'secret.txt'), 'w') as file:
+            file.write('secret')
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_file_response(self):
+        response = self.client.get('/media/posts/image.jpg')
+        self.assertEqual(response['Content-Type'], 'image/jpeg')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        etag = response['ETag']
+        response = self.client.get('/media/posts/image.jpg',
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get('/media/secret.txt')
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get('/media/posts/../secret.txt')
+        self.assertEqual(response.status_code, 404)
+
+    def test_range(self):
+        response = self.client.get('/media/posts/image.jpg',
+                                   HTTP_RANGE='bytes=10-19')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 10-19/1024')
+        self.assertEqual(response['Content-Length'], '10')
+        self.assertEqual(b''.join(response.streaming_content),
+                         self.content[10:20])
+        # Диапазон отдается файлом с позиции start, как и весь файл
+        request = RequestFactory().get('/media/posts/image.jpg',
+                                       HTTP_RANGE='bytes=10-19')
+        response = serve_media(request, 'posts/image.jpg')
+        file = response.file_to_stream
+        self.assertEqual(os.lseek(file.fileno(), 0, os.SEEK_CUR), 10)
+        response.close()
+        response = self.client.get('/media/posts/image.jpg',
+                                   HTTP_RANGE='bytes=-4')
+        self.assertEqual(b''.join(response.streaming_content),
+                         self.content[-4:])
+        response = self.client.get('/media/posts/image.jpg',
+                                   HTTP_RANGE='bytes=2000-')
+        self.assertEqual(response.status_code, 416)
+        response = self.client.get('/media/posts/image.jpg',
+                                   HTTP_RANGE='bytes=0-9',
+                                   HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        response.close()
+
+    @override_settings(MEDIA_SENDFILE='x-accel-redirect')
+    def test_x_accel_redirect(self):
+        response = self.client.get('/media/posts/image.jpg')
+        self.assertEqual(response['X-Accel-Redirect'],
+                         '/internal-media/posts/image.jpg')
+        self.assertEqual(response.content, b'')
+        self.assertIn('ETag', response)
+
+
+class CompressionTest(TestCase):
+    '''Тестирование сжатия ответов и потоковой отдачи лент'''
+    def setUp(self):
+        metrics._views.clear()
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="reader", email="reader@user.com", password="*yxW$kE8")
+        for number in range(3):
+            Post.objects.create(
+                text='Публикация номер {} '.format(number) * 20,
+                author=self.user)
+
+    def test_gzip(self):
+        response = self.client.get('/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        html = gzip.decompress(response.content).decode()
+        self.assertIn('Публикация номер 2', html)
+        response = self.client.get('/')
+        self.assertNotIn('Content-Encoding', response)
+        self.assertContains(response, 'Публикация номер 2')
+        sizes = metrics._views['index']
+        self.assertLess(sizes['sent_bytes'], sizes['response_bytes'])
+
+    @override_settings(STREAM_FEEDS=True)
+    def test_streamed_feed(self):
+        self.client.force_login(self.user)
+        response = self.client.get('/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        html = gzip.decompress(
+            b''.join(response.streaming_content)).decode()
+        self.assertNotIn('<!-- feed:', html)
+        self.assertLess(html.index('Последние обновления'),
+                        html.index('Публикация номер 2'))
+        self.assertLess(html.index('Публикация номер 0'),
+                        html.index('</html>'))
+        sizes = metrics._views['index']
+        self.assertLess(sizes['sent_bytes'], sizes['response_bytes'])
+        response = self.client.get('/follow/')
+        self.assertContains(response, 'нет избранных авторов')
+
+    @override_settings(STREAM_FEEDS=True)
+    def test_streamed_chunks_flushed(self):
+        self.client.force_login(self.user)
+        response = self.client.get('/', HTTP_ACCEPT_ENCODING='gzip')
+        chunks = iter(response.streaming_content)
+        decompressor = zlib.decompressobj(wbits=31)
+        # Шапка страницы распаковывается до того, как отрисованы карточки
+        with mock.patch('django.template.backends.django.Template.render',
+                        side_effect=AssertionError) as render:
+            head = decompressor.decompress(next(chunks)).decode()
+        render.assert_not_called()
+        self.assertIn('Последние обновления', head)
+        self.assertNotIn('Публикация номер', head)
+        html = head + b''.join(
+            decompressor.decompress(chunk) for chunk in chunks).decode()
+        self.assertIn('Публикация номер 0', html)
+        response = self.client.get('/follow/')
+        self.assertContains(response, 'нет избранных авторов')
+
+
+class ThrottleTest(TestCase):
+    '''Тестирование ограничения частоты записи'''
+    def setUp(self):
+        metrics._views.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="writer", email="writer@user.com", password="*yxW$kE8")
+        self.author = User.objects.create_user(
+            username="author", email="author@user.com", password="*yxW$kE8")
+
+    @override_settings(THROTTLE_RATES={'new_post': (2, 60)})
+    def test_token_bucket(self):
+        self.client.force_login(self.user)
+        for number in range(2):
+            response = self.client.post(
+                '/new/', {'text': 'Запись {}'.format(number)})
+            self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.client.get('/new/').status_code, 200)
+        response = self.client.post('/new/', {'text': 'Лишняя запись'})
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '30')
+        self.assertEqual(Post.objects.count(), 2)
+        self.assertEqual(metrics._views['new_post']['throttled'], 1)
+
+        other = Client()
+        other.force_login(self.author)
+        response = other.post('/new/', {'text': 'Запись автора'})
+        self.assertEqual(response.status_code, 302)
+        with mock.patch('time.time', return_value=time.time() + 30):
+            response = self.client.post('/new/', {'text': 'Позже'})
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(THROTTLE_RATES={'profile_follow': (1, 60),
+                                       'signup': (1, 60)})
+    def test_get_routes_and_anonymous(self):
+        self.client.force_login(self.user)
+        self.client.get('/author/follow')
+        response = self.client.get('/author/follow')
+        self.assertEqual(response.status_code, 429)
+        signup = {'username': 'new', 'email': 'new@user.com',
+                  'password1': '*yxW$kE8', 'password2': '*yxW$kE8'}
+        anonymous = Client(REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(anonymous.post('/auth/signup/', signup).status_code,
+                         302)
+        signup['username'] = 'newer'
+        self.assertEqual(anonymous.post('/auth/signup/', signup).status_code,
+                         429)
+        response = Client(REMOTE_ADDR='10.0.0.2').post('/auth/signup/',
+                                                       signup)
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(THROTTLE_RATES={'signup': (1, 60)},
+                       THROTTLE_IP_HEADER='HTTP_X_FORWARDED_FOR')
+    def test_spoofed_forwarded_for(self):
+        signup = {'username': 'new', 'email': 'new@user.com',
+                  'password1': '*yxW$kE8', 'password2': '*yxW$kE8'}
+        response = self.client.post('/auth/signup/', signup,
+                                    HTTP_X_FORWARDED_FOR='10.0.0.1')
+        self.assertEqual(response.status_code, 302)
+        signup['username'] = 'newer'
+        response = self.client.post('/auth/signup/', signup,
+                                    HTTP_X_FORWARDED_FOR='1.2.3.4, 10.0.0.1')
+        self.assertEqual(response.status_code, 429)
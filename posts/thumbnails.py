@@ -0,0 +1,117 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, transaction
+from django.utils import timezone
+from sorl.thumbnail import default, get_thumbnail
+from sorl.thumbnail.base import ThumbnailBackend
+from sorl.thumbnail.conf import defaults as default_settings
+from sorl.thumbnail.conf import settings
+from sorl.thumbnail.images import ImageFile
+
+from .cache import bump_generations, feed_scopes
+from .models import Post
+
+logger = logging.getLogger(__name__)
+
+# Варианты изображения в карточке публикации: ширина для srcset и
+# геометрия sorl-thumbnail. Каждый вариант создается во всех FORMATS
+CARD_VARIANTS = ((480, '480x170'), (960, '960x339'))
+CARD_OPTIONS = {'crop': 'center', 'upscale': True}
+CARD_SIZES = '(min-width: 768px) 720px, 100vw'
+FORMATS = ('JPEG', 'WEBP')
+
+_executor = ThreadPoolExecutor(max_workers=1,
+                               thread_name_prefix='thumbnails')
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+class PostThumbnailBackend(ThumbnailBackend):
+    '''Бэкенд sorl-thumbnail, который умеет искать готовую миниатюру
+    без обращения к исходному изображению'''
+    def get_cached_thumbnail(self, file_, geometry_string, **options):
+        source = ImageFile(file_)
+        if settings.THUMBNAIL_PRESERVE_FORMAT:
+            options.setdefault('format', self._get_format(source))
+        for key, value in self.default_options.items():
+            options.setdefault(key, value)
+        for key, attr in self.extra_options:
+            value = getattr(settings, attr)
+            if value != getattr(default_settings, attr):
+                options.setdefault(key, value)
+        name = self._get_thumbnail_filename(source, geometry_string, options)
+        return default.kvstore.get(ImageFile(name, default.storage))
+
+
+def generate_thumbnails(name):
+    '''Создает все миниатюры изображения, уже готовые пропускает'''
+    for _, geometry in CARD_VARIANTS:
+        for image_format in FORMATS:
+            get_thumbnail(name, geometry, format=image_format,
+                          **CARD_OPTIONS)
+
+
+def _generate_in_background(name, post_id):
+    try:
+        generate_thumbnails(name)
+        if post_id is not None:
+            # Карточка публикации закеширована по updated_at, а ленты и
+            # страницы - по поколениям; до этого они показывали исходное
+            # изображение вместо миниатюр. update() не отправляет
+            # сигналы, поэтому поколения сбрасываются здесь
+            Post.objects.filter(pk=post_id).update(
+                updated_at=timezone.now())
+            post = Post.objects.filter(pk=post_id).values_list(
+                'pk', 'author_id', 'group_id').first()
+            if post is not None:
+                bump_generations(feed_scopes(*post))
+    except Exception:
+        logger.exception('Не удалось создать миниатюры для %s', name)
+    finally:
+        with _pending_lock:
+            _pending.discard(name)
+        connection.close()
+
+
+def _submit(name, post_id):
+    with _pending_lock:
+        if name in _pending:
+            return
+        _pending.add(name)
+    _executor.submit(_generate_in_background, name, post_id)
+
+
+def schedule_thumbnails(name, post_id=None):
+    '''Создает миниатюры в фоновом потоке после фиксации транзакции'''
+    transaction.on_commit(lambda: _submit(name, post_id))
+
+
+def card_image(image, post_id=None):
+    '''Адреса вариантов изображения для карточки публикации. Пока
+    миниатюры не готовы, отдается исходное изображение, а миниатюры
+    ставятся в очередь на создание. С post_id после создания миниатюр
+    сбрасываются кеши карточки и лент публикации'''
+    srcsets = {}
+    for image_format in FORMATS:
+        variants = []
+        for width, geometry in CARD_VARIANTS:
+            # Миниатюры ищутся и создаются по имени файла: ключ
+            # sorl-thumbnail зависит и от хранилища, а у имени и у поля
+            # модели они разные
+            thumbnail = default.backend.get_cached_thumbnail(
+                image.name, geometry, format=image_format, **CARD_OPTIONS)
+            if thumbnail is None:
+                schedule_thumbnails(image.name, post_id)
+                return {'src': image.url}
+            variants.append((width, thumbnail.url))
+        srcsets[image_format] = variants
+    return {
+        'src': srcsets['JPEG'][-1][1],
+        'srcset': ', '.join('{} {}w'.format(url, width)
+                            for width, url in srcsets['JPEG']),
+        'webp_srcset': ', '.join('{} {}w'.format(url, width)
+                                 for width, url in srcsets['WEBP']),
+        'sizes': CARD_SIZES,
+    }
@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q
+
+from .models import Follow, Post, ProfileStats, TimelineEntry
+
+BATCH_SIZE = 1000
+
+
+def is_fanned_out(author_id):
+    '''Пишутся ли публикации автора в ленты подписчиков. У авторов
+    с очень большим числом подписчиков лента собирается при чтении'''
+    follower_count = ProfileStats.objects.filter(
+        user_id=author_id).values_list('follower_count', flat=True).first()
+    return (follower_count or 0) <= settings.TIMELINE_FANOUT_LIMIT
+
+
+def fan_out(post):
+    '''Добавляет новую публикацию в ленты подписчиков автора. Если
+    автор слишком популярен, публикация помечается как не записанная в
+    ленты и будет добавляться к ним при чтении, даже когда подписчиков
+    у автора станет меньше'''
+    if not is_fanned_out(post.author_id):
+        post.fanned_out = False
+        Post.objects.filter(pk=post.pk).update(fanned_out=False)
+        return
+    followers = Follow.objects.filter(
+        author_id=post.author_id).values_list('user_id', flat=True)
+    batch = []
+    for follower_id in followers.iterator():
+        batch.append(TimelineEntry(follower_id=follower_id, post=post,
+                                   pub_date=post.pub_date))
+        if len(batch) >= BATCH_SIZE:
+            TimelineEntry.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    TimelineEntry.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+def backfill(follower_id, author_id):
+    '''Заполняет ленту нового подписчика последними публикациями автора'''
+    if not is_fanned_out(author_id):
+        return
+    posts = Post.objects.filter(author_id=author_id).order_by(
+        '-pub_date', '-pk').values_list(
+            'pk', 'pub_date')[:settings.TIMELINE_BACKFILL_LIMIT]
+    TimelineEntry.objects.bulk_create(
+        [TimelineEntry(follower_id=follower_id, post_id=pk, pub_date=pub_date)
+         for pk, pub_date in posts],
+        batch_size=BATCH_SIZE, ignore_conflicts=True)
+
+
+def prune(follower_id, author_id):
+    '''Убирает публикации автора из ленты отписавшегося пользователя'''
+    TimelineEntry.objects.filter(follower_id=follower_id,
+                                 post__author_id=author_id).delete()
+
+
+def follow_feed(user):
+    '''Возвращает публикации для ленты подписок и параметры постраничного
+    вывода. Обычно это чтение одного диапазона индекса ленты, публикации
+    авторов-миллионников и публикации, которые не были записаны в ленты,
+    добавляются к ней при чтении'''
+    post_list = Post.objects.select_related('group', 'author')
+    not_fanned_out = Post.objects.filter(author=OuterRef('author'),
+                                         fanned_out=False)
+    fan_in_authors = list(Follow.objects.filter(user=user).annotate(
+        has_fan_in_posts=Exists(not_fanned_out)).filter(
+            Q(author__stats__follower_count__gt=settings.TIMELINE_FANOUT_LIMIT)
+            | Q(has_fan_in_posts=True)).values_list('author_id', flat=True))
+    if fan_in_authors:
+        timeline = TimelineEntry.objects.filter(follower=user).values('post')
+        return post_list, {
+            'where': Q(pk__in=timeline) | Q(author__in=fan_in_authors)}
+    return post_list, {
+        'key': ('timeline__pub_date', 'timeline__post'),
+        'where': Q(timeline__follower=user)}
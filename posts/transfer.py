@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+
+from django.utils.dateparse import parse_datetime
+
+from .models import Comment, Follow, Group, Post, User
+
+# Порядок важен: записи ссылаются только на выгруженные раньше.
+# Производные данные (счетчики, ленты, поисковый индекс) не выгружаются,
+# а пересчитываются после загрузки
+MODELS = (
+    ('user', User, ('id', 'username', 'first_name', 'last_name', 'email',
+                    'password', 'is_active', 'is_staff', 'is_superuser',
+                    'date_joined', 'last_login')),
+    ('group', Group, ('id', 'title', 'slug', 'description')),
+    ('post', Post, ('id', 'text', 'pub_date', 'author_id', 'group_id',
+                    'image', 'fanned_out', 'updated_at')),
+    ('comment', Comment, ('id', 'post_id', 'author_id', 'text', 'created',
+                          'updated_at')),
+    ('follow', Follow, ('id', 'user_id', 'author_id')),
+)
+
+DATETIME_FIELDS = {'date_joined', 'last_login', 'pub_date', 'created',
+                   'updated_at'}
+
+REBUILD_COMMANDS = ('rebuild_comment_counts', 'rebuild_profile_stats',
+                    'rebuild_timelines', 'rebuild_search_index')
+
+
+def to_instance(model, fields):
+    '''Создает несохраненный объект из записи выгрузки'''
+    for name in DATETIME_FIELDS.intersection(fields):
+        if fields[name] is not None:
+            fields[name] = parse_datetime(fields[name])
+    return model(**fields)
+
+
+@contextmanager
+def keep_timestamps(model):
+    '''Отключает auto_now и auto_now_add, чтобы bulk_create сохранил даты
+    из выгрузки'''
+    flags = [(field, name) for field in model._meta.concrete_fields
+             for name in ('auto_now', 'auto_now_add')
+             if getattr(field, name, False)]
+    for field, name in flags:
+        setattr(field, name, False)
+    try:
+        yield
+    finally:
+        for field, name in flags:
+            setattr(field, name, True)
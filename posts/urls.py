@@ -1,6 +1,6 @@
 from django.urls import path
 
-from . import views
+from . import api, views
 
 urlpatterns = [
     path("", views.index, name="index"),
@@ -8,6 +8,13 @@ urlpatterns = [
     path("add-group/", views.add_group, name="add_group"),
     path("new/", views.new_post, name="new_post"),
     path("follow/", views.follow_index, name="follow_index"),
+    path("search/", views.search, name="search"),
+    path("api/v1/posts/", api.post_list, name="api_posts"),
+    path("api/v1/posts/<int:post_id>/", api.post_detail, name="api_post"),
+    path("api/v1/posts/<int:post_id>/comments/", api.comment_list,
+         name="api_comments"),
+    path("api/v1/groups/", api.group_list, name="api_groups"),
+    path("api/v1/follow/", api.follow_list, name="api_follow"),
     path("<username>/follow", views.profile_follow, name="profile_follow"),
     path("<username>/unfollow", views.profile_unfollow,
          name="profile_unfollow"),
@@ -18,6 +25,8 @@ urlpatterns = [
          name="post_delete"),
     path("<username>/<int:post_id>/comment/", views.add_comment,
          name="add_comment"),
+    path("<username>/<int:post_id>/comments/", views.post_comments,
+         name="post_comments"),
     path("<username>/<int:post_id>/<int:comment_id>/comment-delete/",
          views.delete_comment, name="delete_comment"),
     path("<username>/<int:post_id>/<int:comment_id>/comment-edit/",
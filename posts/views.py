@@ -1,41 +1,142 @@
+from uuid import uuid4
+
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
-from django.db.models import Count
+from django.db.models import Exists, OuterRef
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
-from django.utils import timezone
+from django.template.loader import get_template, render_to_string
+from django.utils.safestring import mark_safe
 
+from .cache import cache_anonymous_page, feed_cache_key
 from .forms import CommentForm, GroupForm, PostForm
-from .models import Comment, Follow, Group, Post, User
+from .models import Comment, Follow, Group, Post, ProfileStats, User
+from .paginator import CursorPaginator
+from .search import search_posts
+from .timeline import follow_feed
+
+POSTS_PER_PAGE = 10
+COMMENTS_PER_PAGE = 20
+
+
+def paginate(request, post_list, key=('pub_date', 'pk'), where=None):
+    '''Постраничный вывод ленты: по курсору, а для старых ссылок
+    вида ?page=N - по номеру страницы'''
+    page_number = request.GET.get('page')
+    if page_number is not None:
+        if where is not None:
+            post_list = post_list.filter(where)
+        paginator = Paginator(
+            post_list.order_by(*('-' + field for field in key)),
+            POSTS_PER_PAGE)
+        return paginator, paginator.get_page(page_number)
+    paginator = CursorPaginator(post_list, POSTS_PER_PAGE, key=key,
+                                where=where)
+    page = paginator.get_page(after=request.GET.get('after'),
+                              before=request.GET.get('before'))
+    return paginator, page
+
+
+def render_feed(request, template_name, context):
+    '''Отрисовывает страницу ленты. С STREAM_FEEDS страница для
+    авторизованного пользователя отдается потоком: сначала все, что
+    стоит до карточек публикаций, затем карточки по одной. Страницы
+    для анонимных посетителей кешируются целиком, поэтому для них
+    поток не нужен'''
+    if not (settings.STREAM_FEEDS and request.user.is_authenticated):
+        return render(request, template_name, context)
+    marker = '<!-- feed:{} -->'.format(uuid4().hex)
+    html = render_to_string(template_name,
+                            dict(context, stream_marker=mark_safe(marker)),
+                            request)
+    if marker not in html:
+        return HttpResponse(html)
+    head, tail = html.split(marker, 1)
+    card = get_template('post_item.html')
+
+    def stream():
+        yield head
+        for post in context['page']:
+            yield card.render({'post': post, 'user': request.user})
+        yield tail
+
+    response = StreamingHttpResponse(stream())
+    # nginx не должен копить поток в буфере
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def index_scopes():
+    return ['all']
+
+
+def group_scopes(slug):
+    group_id = Group.objects.filter(slug=slug).values_list(
+        'pk', flat=True).first()
+    if group_id is not None:
+        return ['group:{}'.format(group_id)]
+
+
+def profile_scopes(username):
+    author_id = User.objects.filter(username=username).values_list(
+        'pk', flat=True).first()
+    if author_id is not None:
+        return ['author:{}'.format(author_id)]
+
+
+def post_scopes(username, post_id):
+    scopes = profile_scopes(username)
+    if scopes is not None:
+        return scopes + ['post:{}'.format(post_id)]
+
+
+def get_profile(request, username):
+    '''Автор страницы со счетчиками и признаком подписки текущего
+    пользователя, одним запросом вместо трех'''
+    users = User.objects.select_related('stats')
+    if request.user.is_authenticated:
+        users = users.annotate(is_followed=Exists(Follow.objects.filter(
+            author=OuterRef('pk'), user=request.user)))
+    user_profile = get_object_or_404(users, username=username)
+    return user_profile, getattr(user_profile, 'is_followed', False)
 
 
+@cache_anonymous_page(index_scopes)
 def index(request):
     '''Главная страница'''
     post_list = Post.objects.select_related(
-        'author', 'group').annotate(
-            comment_count=Count('commented_post')).order_by("-pub_date").all()
-    paginator = Paginator(post_list, 10)
-    page_number = request.GET.get('page')
-    page = paginator.get_page(page_number)
+        'author', 'group').order_by("-pub_date", "-pk").all()
+    paginator, page = paginate(request, post_list)
     index_page = True
-    return render(request, "index.html", {'page': page,
-                                          'paginator': paginator,
-                                          'index_page': index_page})
+    feed_key = feed_cache_key(request, 'all', page)
+    return render_feed(request, "index.html", {'page': page,
+                                               'paginator': paginator,
+                                               'index_page': index_page,
+                                               'feed_key': feed_key})
 
 
+@cache_anonymous_page(group_scopes)
 def group_posts(request, slug):
     '''Страница с публикиями связанными с группой'''
     group = get_object_or_404(Group, slug=slug)
     post_list = Post.objects.filter(
         group=group).select_related(
-            'author', 'group').annotate(
-                comment_count=Count(
-                    'commented_post')).order_by("-pub_date").all()
-    paginator = Paginator(post_list, 10)
-    page_number = request.GET.get('page')
-    page = paginator.get_page(page_number)
-    return render(request, "group.html", {'group': group,
-                                          'page': page,
-                                          'paginator': paginator})
+            'author', 'group').order_by("-pub_date", "-pk").all()
+    paginator, page = paginate(request, post_list)
+    feed_key = feed_cache_key(request, 'group:{}'.format(group.pk), page)
+    return render_feed(request, "group.html", {'group': group,
+                                               'page': page,
+                                               'paginator': paginator,
+                                               'feed_key': feed_key})
+
+
+def search(request):
+    '''Страница поиска по публикациям и комментариям'''
+    query = request.GET.get('q', '').strip()
+    page = search_posts(query, POSTS_PER_PAGE,
+                        after=request.GET.get('after'))
+    return render(request, "search.html", {'query': query, 'page': page})
 
 
 @login_required
@@ -54,57 +155,62 @@ def new_post(request):
     return render(request, 'new_post.html', {'form': form, 'title': title})
 
 
+def comment_page(post_id, after=None):
+    '''Страница комментариев к публикации, новые сверху'''
+    comments = Comment.objects.filter(post=post_id).select_related('author')
+    paginator = CursorPaginator(comments, COMMENTS_PER_PAGE,
+                                key=('created', 'pk'),
+                                row_key=('created', 'id'))
+    return paginator.get_page(after=after)
+
+
+@cache_anonymous_page(post_scopes)
 def post_view(request, post_id, username):
     '''Страница отдельной публикации'''
-    user_profile = get_object_or_404(
-        User.objects.filter(username=username).annotate(
-            follower_count=Count('follower', distinct=True),
-            following_count=Count('following', distinct=True),
-            post_count=Count('post_author', distinct=True)))
+    user_profile, following = get_profile(request, username)
+    stats = ProfileStats.for_user(user_profile)
     post = get_object_or_404(
-        Post.objects.annotate(
-            comment_count=Count(
-                'commented_post')).select_related('author', 'group'),
-        pk=post_id)
-    post_comment = Comment.objects.filter(
-        post=post_id).select_related('author').order_by("-created").all()
+        Post.objects.select_related('author', 'group'), pk=post_id)
+    comments = comment_page(post_id, request.GET.get('comments_after'))
     form = CommentForm()
-    following = False
-    if request.user.is_authenticated:
-        if Follow.objects.filter(author=user_profile,
-           user=request.user).exists():
-            following = True
     return render(request, 'post_view.html', {'post': post,
                                               'profile': user_profile,
-                                              'comments': post_comment,
+                                              'stats': stats,
+                                              'comments': comments,
+                                              'username': username,
+                                              'post_id': post_id,
                                               'form': form,
                                               'following': following})
 
 
+@cache_anonymous_page(post_scopes)
+def post_comments(request, username, post_id):
+    '''Фрагмент со следующей страницей комментариев, подгружается на
+    странице публикации'''
+    get_object_or_404(Post, pk=post_id, author__username=username)
+    comments = comment_page(post_id, request.GET.get('after'))
+    return render(request, 'comment_list.html', {'comments': comments,
+                                                 'username': username,
+                                                 'post_id': post_id})
+
+
+@cache_anonymous_page(profile_scopes)
 def profile(request, username):
     '''Страница с публикациями пользователя'''
-    user_profile = get_object_or_404(
-        User.objects.filter(
-            username=username).annotate(
-                follower_count=Count('follower', distinct=True),
-                following_count=Count('following', distinct=True)))
+    user_profile, following = get_profile(request, username)
+    stats = ProfileStats.for_user(user_profile)
     post_list = Post.objects.filter(
         author=user_profile).select_related(
-            'group', 'author').annotate(
-                comment_count=Count(
-                    'commented_post')).order_by("-pub_date").all()
-    paginator = Paginator(post_list, 10)
-    page_number = request.GET.get('page')
-    page = paginator.get_page(page_number)
-    following = False
-    if request.user.is_authenticated:
-        if Follow.objects.filter(author=user_profile,
-           user=request.user).exists():
-            following = True
-    return render(request, "profile.html", {'profile': user_profile,
-                                            'page': page,
-                                            'paginator': paginator,
-                                            'following': following})
+            'group', 'author').order_by("-pub_date", "-pk").all()
+    paginator, page = paginate(request, post_list)
+    feed_key = feed_cache_key(
+        request, 'author:{}'.format(user_profile.pk), page)
+    return render_feed(request, "profile.html", {'profile': user_profile,
+                                                 'stats': stats,
+                                                 'page': page,
+                                                 'paginator': paginator,
+                                                 'following': following,
+                                                 'feed_key': feed_key})
 
 
 @login_required
@@ -118,9 +224,7 @@ def post_edit(request, username, post_id):
                             files=request.FILES or None,
                             instance=post)
             if form.is_valid():
-                post = form.save(commit=False)
-                post.pub_date = timezone.now()
-                post.save()
+                post = form.save()
                 return redirect('post', post_id=post.pk, username=username)
         else:
             form = PostForm(instance=post)
@@ -169,17 +273,11 @@ def add_comment(request, username, post_id):
 def follow_index(request):
     '''Страница с публикациями избранных пользователей'''
     follow_page = True
-    post_list = Post.objects.filter(
-        author__following__user=request.user).select_related(
-            'group', 'author').annotate(
-                comment_count=Count(
-                    'commented_post')).order_by("-pub_date").all()
-    paginator = Paginator(post_list, 10)
-    page_number = request.GET.get('page')
-    page = paginator.get_page(page_number)
-    return render(request, "follow.html", {'page': page,
-                                           'paginator': paginator,
-                                           'follow_page': follow_page})
+    post_list, options = follow_feed(request.user)
+    paginator, page = paginate(request, post_list, **options)
+    return render_feed(request, "follow.html", {'page': page,
+                                                'paginator': paginator,
+                                                'follow_page': follow_page})
 
 
 @login_required
@@ -188,10 +286,7 @@ def profile_follow(request, username):
     followed_author = get_object_or_404(User, username=username)
     if followed_author == request.user:
         return redirect('profile', username=username)
-    if Follow.objects.filter(user=request.user,
-                             author=followed_author).exists():
-        return redirect('profile', username=username)
-    Follow.objects.create(author=followed_author, user=request.user)
+    Follow.objects.get_or_create(author=followed_author, user=request.user)
     return redirect('profile', username=username)
 
 
@@ -222,11 +317,11 @@ def edit_comment(request, username, post_id, comment_id):
         if request.method == 'POST':
             form = CommentForm(request.POST, instance=comment)
             if form.is_valid():
-                comment = form.save(commit=False)
-                comment.created = timezone.now()
-                comment.save()
+                form.save()
                 return redirect('post', username=username, post_id=post_id)
         form = CommentForm(instance=comment)
+    else:
+        return redirect('post', username=username, post_id=post_id)
     return render(request, "new_post.html", {'form': form, 'title': title})
 
 
@@ -1,3 +0,0 @@
-define( [ "./selector-sizzle" ], function() {
-	"use strict";
-} );
@@ -1,3 +1,14 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Email
+
+
+class EmailAdmin(admin.ModelAdmin):
+    list_display = ("pk", "subject", "recipients", "created", "attempts",
+                    "sent_at")
+    list_filter = ("sent_at",)
+    search_fields = ("recipients",)
+    readonly_fields = ("created", "sent_at", "last_error")
+
+
+admin.site.register(Email, EmailAdmin)
@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
-from django.core.mail import send_mail
+
+from .models import Email
 
 User = get_user_model()
 
@@ -12,6 +13,10 @@ class CreationForm(UserCreationForm):
         fields = ("first_name", "last_name", "username", "email")
 
     def send_email(self):
+        '''Ставит письмо о регистрации в очередь на отправку'''
         email = self.cleaned_data['email']
-        send_mail('Подтверждение регистрации Yatube', 'Вы зарегистрированы!',
-                  'Yatube.ru <admin@yatube.ru>', [email], fail_silently=False)
+        if not email:
+            return
+        Email.enqueue('Подтверждение регистрации Yatube',
+                      'Вы зарегистрированы!',
+                      'Yatube.ru <admin@yatube.ru>', [email])
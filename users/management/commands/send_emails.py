@@ -0,0 +1,86 @@
+import time
+from datetime import timedelta
+
+from django.core import mail
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from users.models import Email
+
+MAX_ATTEMPTS = 5
+# Пауза перед повтором: BACKOFF, затем вдвое больше, но не дольше
+# MAX_BACKOFF секунд
+BACKOFF = 60
+MAX_BACKOFF = 60 * 60
+# На это время письма пачки закрепляются за воркером. Если воркер
+# упадет, не успев их отправить, после паузы их заберет другой
+LEASE = 60 * 5
+
+
+class Command(BaseCommand):
+    help = ('Отправляет письма из очереди пачками через одно '
+            'соединение с почтовым сервером')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--loop', action='store_true',
+                            help='Работать постоянно, проверяя очередь '
+                                 'каждые --interval секунд')
+        parser.add_argument('--interval', type=float, default=5)
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = self.send_batch(options['batch_size'])
+            if sent or failed:
+                self.stdout.write('Отправлено: {}, ошибок: {}'.format(
+                    sent, failed))
+            if not options['loop']:
+                break
+            if sent + failed < options['batch_size']:
+                time.sleep(options['interval'])
+
+    def claim(self, batch_size):
+        '''Забирает пачку писем, чтобы другие воркеры ее не взяли'''
+        with transaction.atomic():
+            emails = list(Email.pending(MAX_ATTEMPTS).select_for_update(
+                skip_locked=True).order_by('send_after')[:batch_size])
+            claimed = Email.objects.filter(
+                pk__in=[email.pk for email in emails])
+            claimed.update(attempts=F('attempts') + 1,
+                           send_after=timezone.now() + timedelta(
+                               seconds=LEASE))
+        for email in emails:
+            email.attempts += 1
+        return emails
+
+    def send_batch(self, batch_size):
+        emails = self.claim(batch_size)
+        if not emails:
+            return 0, 0
+        sent = failed = 0
+        connection = mail.get_connection()
+        try:
+            connection.open()
+        except Exception as error:
+            for email in emails:
+                email.retry_later(error, BACKOFF, MAX_BACKOFF)
+            return 0, len(emails)
+        try:
+            for email in emails:
+                message = mail.EmailMessage(
+                    email.subject, email.body, email.from_email,
+                    email.recipient_list(), connection=connection)
+                try:
+                    message.send()
+                except Exception as error:
+                    email.retry_later(error, BACKOFF, MAX_BACKOFF)
+                    failed += 1
+                else:
+                    Email.objects.filter(pk=email.pk).update(
+                        sent_at=timezone.now(), last_error='')
+                    sent += 1
+        finally:
+            connection.close()
+        return sent, failed
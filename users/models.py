@@ -1,3 +1,54 @@
+from datetime import timedelta
+
 from django.db import models
+from django.utils import timezone
+
+
+class Email(models.Model):
+    '''Письмо в очереди на отправку. Отправляет команда send_emails'''
+    subject = models.CharField("Тема", max_length=255)
+    body = models.TextField("Текст")
+    from_email = models.CharField("Отправитель", max_length=255)
+    recipients = models.TextField("Получатели",
+                                  help_text="По одному адресу в строке")
+    created = models.DateTimeField("Дата создания", auto_now_add=True)
+    send_after = models.DateTimeField("Отправить после",
+                                      default=timezone.now)
+    attempts = models.PositiveSmallIntegerField("Попыток", default=0)
+    sent_at = models.DateTimeField("Дата отправки", blank=True, null=True)
+    last_error = models.TextField("Последняя ошибка", blank=True)
+
+    class Meta:
+        verbose_name = "Письмо"
+        verbose_name_plural = "Письма"
+        indexes = [
+            models.Index(fields=["sent_at", "send_after"],
+                         name="users_email_queue_idx"),
+        ]
+
+    def __str__(self):
+        return self.subject
+
+    @classmethod
+    def enqueue(cls, subject, body, from_email, recipient_list):
+        '''Ставит письмо в очередь вместо отправки во время запроса'''
+        return cls.objects.create(subject=subject, body=body,
+                                  from_email=from_email,
+                                  recipients='\n'.join(recipient_list))
+
+    @classmethod
+    def pending(cls, max_attempts):
+        '''Письма, которые пора отправить'''
+        return cls.objects.filter(sent_at__isnull=True,
+                                  send_after__lte=timezone.now(),
+                                  attempts__lt=max_attempts)
+
+    def recipient_list(self):
+        return self.recipients.split('\n')
 
-# Create your models here.
+    def retry_later(self, error, backoff, max_backoff):
+        '''Откладывает письмо с экспоненциально растущей паузой'''
+        delay = min(backoff * 2 ** max(self.attempts - 1, 0), max_backoff)
+        self.send_after = timezone.now() + timedelta(seconds=delay)
+        self.last_error = str(error)
+        self.save(update_fields=['send_after', 'last_error'])
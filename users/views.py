@@ -11,5 +11,6 @@ class SignUp(CreateView):
     template_name = "signup.html"
 
     def form_valid(self, form):
+        response = super().form_valid(form)
         form.send_email()
-        return super().form_valid(form)
+        return response
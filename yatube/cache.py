@@ -0,0 +1,259 @@
+"""Двухуровневый кеш: ограниченный LRU в памяти процесса перед общим
+для всех воркеров кешем (таблица в базе или файлы).
+
+Каждая запись и удаление в общем кеше публикуется в журнал
+инвалидаций, который лежит в том же общем кеше. Номер записи журнала
+выделяет счетчик в таблице posts.CacheSequence: UPDATE с F() атомарен
+в отличие от incr кеша в базе, который читает и записывает значение
+отдельными запросами и при гонке выдает двум воркерам один номер.
+
+Воркеры читают журнал не чаще раза в SYNC_INTERVAL секунд и убирают
+изменившиеся ключи из своего LRU. Если журнал потерян или отстал больше
+чем на JOURNAL_SIZE записей, либо его записи истекли (воркер простаивал
+дольше JOURNAL_TIMEOUT), LRU очищается целиком. Кроме того, запись
+живет в LRU не дольше LOCAL_TIMEOUT секунд, это ограничивает
+устаревание при гонках.
+
+Ключи с префиксами из IMMUTABLE_PREFIXES содержат версию данных
+(поколение ленты, дату изменения публикации), и значение под таким
+ключом никогда не меняется. Их запись не попадает в журнал: это одна
+запись в общий кеш вместо трех. set_many и delete_many публикуют в
+журнал одну запись на все ключи.
+
+Пример настройки:
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'yatube.cache.TwoTierCache',
+            'OPTIONS': {'SHARED': 'shared', 'MAX_ENTRIES': 1000,
+                        'IMMUTABLE_PREFIXES': ('anonymous_page:',)},
+        },
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'yatube_cache',
+            'OPTIONS': {'MAX_ENTRIES': 100000, 'CULL_FREQUENCY': 10},
+        },
+    }
+"""
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.db import router, transaction
+from django.db.models import F
+
+SEQUENCE_KEY = 'two_tier:sequence'
+JOURNAL_KEY = 'two_tier:journal:{}'
+CLEAR_ALL = '*'
+JOURNAL_TIMEOUT = 60 * 5
+
+# LRU, счетчики и состояние журнала общие для всех потоков процесса,
+# как у LocMemCache: Django создает экземпляр кеша в каждом потоке
+_locals = {}
+_stats = {}
+_sync_state = {}
+_locks = {}
+
+_missing = object()
+
+
+class TwoTierCache(BaseCache):
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._shared_alias = options.get('SHARED', 'shared')
+        self._local_timeout = options.get('LOCAL_TIMEOUT', 5)
+        self._sync_interval = options.get('SYNC_INTERVAL', 0.5)
+        self._journal_size = options.get('JOURNAL_SIZE', 1000)
+        self._immutable = tuple(options.get('IMMUTABLE_PREFIXES', ()))
+        self._local = _locals.setdefault(location, OrderedDict())
+        self._stats = _stats.setdefault(location, Counter())
+        self._state = _sync_state.setdefault(
+            location, {'seen': None, 'synced_at': 0})
+        self._lock = _locks.setdefault(location, threading.RLock())
+
+    @property
+    def _shared(self):
+        return caches[self._shared_alias]
+
+    def stats(self):
+        '''Счетчики попаданий, промахов и вытеснений по уровням'''
+        with self._lock:
+            stats = dict(self._stats)
+            size = len(self._local)
+        return {
+            'local': {'hits': stats.get('local_hits', 0),
+                      'misses': stats.get('local_misses', 0),
+                      'evictions': stats.get('local_evictions', 0),
+                      'invalidations': stats.get('local_invalidations', 0),
+                      'size': size},
+            'shared': {'hits': stats.get('shared_hits', 0),
+                       'misses': stats.get('shared_misses', 0)},
+        }
+
+    def get(self, key, default=None, version=None):
+        local_key = self.make_key(key, version)
+        self._sync()
+        with self._lock:
+            entry = self._local.get(local_key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._local.move_to_end(local_key)
+                self._stats['local_hits'] += 1
+                return pickle.loads(entry[1])
+            self._stats['local_misses'] += 1
+        value = self._shared.get(key, _missing, version=version)
+        if value is _missing:
+            self._stats['shared_misses'] += 1
+            return default
+        self._stats['shared_hits'] += 1
+        self._store_local(local_key, value, self._local_timeout)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._shared.set(key, value, timeout, version=version)
+        self._changed(key, version, value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        if not self._shared.add(key, value, timeout, version=version):
+            return False
+        self._changed(key, version, value, timeout)
+        return True
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self._shared.set_many(data, timeout, version=version)
+        changed = []
+        for key, value in data.items():
+            local_key = self.make_key(key, version)
+            self._forget(local_key)
+            if key not in failed:
+                self._store_local(local_key, value, timeout)
+            if not key.startswith(self._immutable):
+                changed.append(local_key)
+        if changed:
+            self._publish(changed)
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._shared.touch(key, timeout, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        value = self._shared.incr(key, delta, version=version)
+        self._changed(key, version, value)
+        return value
+
+    def delete(self, key, version=None):
+        self._shared.delete(key, version=version)
+        self._changed(key, version)
+
+    def delete_many(self, keys, version=None):
+        self._shared.delete_many(keys, version=version)
+        local_keys = [self.make_key(key, version) for key in keys]
+        for local_key in local_keys:
+            self._forget(local_key)
+        if local_keys:
+            self._publish(local_keys)
+
+    def has_key(self, key, version=None):
+        return self.get(key, _missing, version=version) is not _missing
+
+    def clear(self):
+        self._shared.clear()
+        with self._lock:
+            self._local.clear()
+        self._publish([CLEAR_ALL])
+
+    def _store_local(self, local_key, value, timeout):
+        expires = self.get_backend_timeout(timeout)
+        now = time.time()
+        if expires is not None and expires <= now:
+            return
+        local_timeout = self._local_timeout
+        if expires is not None:
+            local_timeout = min(local_timeout, expires - now)
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._local[local_key] = (time.monotonic() + local_timeout,
+                                      pickled)
+            self._local.move_to_end(local_key)
+            while len(self._local) > self._max_entries:
+                self._local.popitem(last=False)
+                self._stats['local_evictions'] += 1
+
+    def _forget(self, local_key):
+        with self._lock:
+            self._local.pop(local_key, None)
+
+    def _changed(self, key, version, value=_missing,
+                 timeout=DEFAULT_TIMEOUT):
+        local_key = self.make_key(key, version)
+        self._forget(local_key)
+        if value is not _missing:
+            self._store_local(local_key, value, timeout)
+        if value is _missing or not key.startswith(self._immutable):
+            self._publish([local_key])
+
+    def _sequences(self):
+        # Модель приложения posts импортируется при первом обращении:
+        # кеши создаются раньше, чем загружены приложения
+        from posts.models import CacheSequence
+        using = router.db_for_write(CacheSequence)
+        return (CacheSequence.objects.using(using),
+                self._shared.make_key(SEQUENCE_KEY), using)
+
+    def current_sequence(self):
+        '''Номер последней записи журнала'''
+        sequences, name, _ = self._sequences()
+        return sequences.filter(pk=name).values_list(
+            'value', flat=True).first() or 0
+
+    def _next_sequence(self):
+        sequences, name, using = self._sequences()
+        with transaction.atomic(using=using):
+            if not sequences.filter(pk=name).update(value=F('value') + 1):
+                sequences.get_or_create(pk=name)
+                sequences.filter(pk=name).update(value=F('value') + 1)
+            return sequences.filter(pk=name).values_list(
+                'value', flat=True).get()
+
+    def _publish(self, local_keys):
+        '''Записывает ключи в журнал инвалидаций для других воркеров'''
+        sequence = self._next_sequence()
+        self._shared.set(JOURNAL_KEY.format(sequence), local_keys,
+                         timeout=JOURNAL_TIMEOUT)
+        with self._lock:
+            if self._state['seen'] == sequence - 1:
+                self._state['seen'] = sequence
+
+    def _sync(self):
+        '''Убирает из LRU ключи, измененные другими воркерами'''
+        now = time.monotonic()
+        with self._lock:
+            if now - self._state['synced_at'] < self._sync_interval:
+                return
+            self._state['synced_at'] = now
+            seen = self._state['seen']
+        sequence = self.current_sequence()
+        if seen is None or sequence == seen:
+            with self._lock:
+                self._state['seen'] = sequence
+            return
+        changed = None
+        if seen < sequence <= seen + self._journal_size:
+            journal_keys = [JOURNAL_KEY.format(number)
+                            for number in range(seen + 1, sequence + 1)]
+            journal = self._shared.get_many(journal_keys)
+            if len(journal) == len(journal_keys):
+                changed = {local_key for local_keys in journal.values()
+                           for local_key in local_keys}
+        with self._lock:
+            if changed is None or CLEAR_ALL in changed:
+                self._stats['local_invalidations'] += len(self._local)
+                self._local.clear()
+            else:
+                for local_key in changed:
+                    if self._local.pop(local_key, None) is not None:
+                        self._stats['local_invalidations'] += 1
+            self._state['seen'] = sequence
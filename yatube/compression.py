@@ -0,0 +1,117 @@
+"""Сжатие ответов на лету: br, если установлен пакет brotli и клиент его
+принимает, иначе gzip. Потоковые ответы сжимаются по частям: после
+каждой части компрессор сбрасывает буфер (Z_SYNC_FLUSH для gzip, flush
+для brotli), и клиент может сразу ее распаковать и показать. Уже
+сжатые ответы (статика с .br/.gz), частичные ответы на Range и файлы,
+которые не сжимаются (картинки), отдаются как есть.
+
+Размер ответа до и после сжатия попадает в метрики представления.
+"""
+import zlib
+
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+from . import metrics
+from .static import accepted_encodings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MIN_LENGTH = 200
+BROTLI_QUALITY = 5
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript',
+                      'application/xml', 'image/svg+xml')
+
+
+def brotli_sequence(sequence):
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for item in sequence:
+        data = compressor.process(item) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def gzip_sequence(sequence):
+    # compress_sequence из Django не сбрасывает буфер и держит данные у
+    # себя, пока не наберется блок; wbits=31 - формат gzip
+    compressor = zlib.compressobj(wbits=31)
+    for item in sequence:
+        data = compressor.compress(item) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def choose_encoding(request):
+    accepted = accepted_encodings(request)
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+def counted(sequence, sizes, index):
+    for item in sequence:
+        sizes[index] += len(item)
+        yield item
+
+
+def recorded(sequence, view, sizes):
+    yield from sequence
+    metrics.record_size(view, *sizes)
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        content_type = response.get('Content-Type', '')
+        if (response.status_code != 200
+                or response.has_header('Content-Encoding')
+                or not content_type.startswith(COMPRESSIBLE_TYPES)):
+            return response
+        view = metrics.view_name(request)
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = choose_encoding(request)
+
+        if response.streaming:
+            sizes = [0, 0]
+            sequence = counted(response.streaming_content, sizes, 0)
+            if encoding == 'br':
+                sequence = brotli_sequence(sequence)
+            elif encoding == 'gzip':
+                sequence = gzip_sequence(sequence)
+            sequence = counted(sequence, sizes, 1)
+            response.streaming_content = recorded(sequence, view, sizes)
+            if encoding:
+                self.mark_encoded(response, encoding)
+            return response
+
+        content = response.content
+        if encoding and len(content) >= MIN_LENGTH:
+            if encoding == 'br':
+                compressed = brotli.compress(content, quality=BROTLI_QUALITY)
+            else:
+                compressed = compress_string(content)
+            if len(compressed) < len(content):
+                response.content = compressed
+                response['Content-Length'] = str(len(compressed))
+                self.mark_encoded(response, encoding)
+        metrics.record_size(view, len(content), len(response.content))
+        return response
+
+    def mark_encoded(self, response, encoding):
+        response['Content-Encoding'] = encoding
+        # Сжатое тело отличается побайтно, но совпадает по смыслу
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        if response.streaming and response.has_header('Content-Length'):
+            del response['Content-Length']
@@ -0,0 +1,72 @@
+"""Чтение с реплик базы данных.
+
+ReplicaMiddleware отмечает запросы безопасными методами (GET, HEAD),
+и в них ReplicaRouter отправляет чтение на одну из реплик из
+REPLICA_DATABASES. Запись и все остальные запросы, а также команды
+manage.py работают с основной базой.
+
+Чтобы пользователь сразу видел свою публикацию, комментарий или
+подписку, после любой записи в базу ответ ставит cookie, и еще
+REPLICA_STICKY_SECONDS секунд все его запросы читают основную базу.
+Запись внутри GET-запроса (например, подписка) тоже переключает
+оставшуюся часть запроса на основную базу.
+"""
+import random
+import threading
+
+from django.conf import settings
+
+STICKY_COOKIE = 'use_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Таблица кеша должна читаться с основной базы, иначе сброс кеша
+# страниц и журнал инвалидаций будут видны с задержкой репликации
+PRIMARY_ONLY_APPS = ('django_cache',)
+
+_state = threading.local()
+
+
+def use_replicas(enabled):
+    '''Разрешает или запрещает чтение с реплик в текущем потоке'''
+    _state.replicas = enabled
+    _state.wrote = False
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = settings.REPLICA_DATABASES
+        if (not replicas or not getattr(_state, 'replicas', False)
+                or model._meta.app_label in PRIMARY_ONLY_APPS):
+            return 'default'
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        # Запись в кеш не меняет данных, которые пользователь мог бы
+        # не увидеть на реплике
+        if model._meta.app_label not in PRIMARY_ONLY_APPS:
+            _state.replicas = False
+            _state.wrote = True
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Реплики содержат те же данные, что и основная база
+        return True
+
+
+class ReplicaMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        use_replicas(request.method in SAFE_METHODS
+                     and STICKY_COOKIE not in request.COOKIES)
+        try:
+            response = self.get_response(request)
+        finally:
+            wrote = getattr(_state, 'wrote', False)
+            use_replicas(False)
+        if wrote and settings.REPLICA_DATABASES:
+            response.set_cookie(STICKY_COOKIE, '1',
+                                max_age=settings.REPLICA_STICKY_SECONDS,
+                                httponly=True)
+        return response
@@ -0,0 +1,138 @@
+"""Раздача загруженных файлов (MEDIA_ROOT).
+
+Доступны только файлы из MEDIA_PUBLIC_DIRS. Сами байты по возможности
+отдает прокси: при MEDIA_SENDFILE = 'x-accel-redirect' ответ содержит
+только заголовок X-Accel-Redirect на internal-location nginx, при
+'x-sendfile' - X-Sendfile с путем к файлу (Apache, lighttpd). Пример
+для nginx:
+
+    location /internal-media/ {
+        internal;
+        alias /path/to/media/;
+    }
+
+Без прокси файл отдается через FileResponse, который использует
+wsgi.file_wrapper (sendfile в gunicorn). Поддерживаются ETag,
+Last-Modified и запросы Range с одним диапазоном: файл открывается с
+начала диапазона, а gunicorn отправляет через sendfile ровно
+Content-Length байт с текущей позиции.
+"""
+import mimetypes
+import os
+import posixpath
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def file_etag(stat):
+    return quote_etag('{:x}-{:x}'.format(int(stat.st_mtime), stat.st_size))
+
+
+def parse_range(header, size):
+    '''Границы (start, end) одного диапазона или None, если заголовка
+    нет или диапазонов несколько. Для недостижимого диапазона - False'''
+    match = RANGE.match(header.strip()) if header else None
+    if match is None:
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start = int(start)
+        end = min(int(end), size - 1) if end else size - 1
+    if start > end or start >= size:
+        return False
+    return start, end
+
+
+class RangeFile:
+    '''Файл, открытый на начале диапазона. read() не выходит за его
+    конец, а fileno() позволяет wsgi.file_wrapper отдать его через
+    sendfile'''
+    def __init__(self, path, start, length):
+        self.file = open(path, 'rb')
+        self.file.seek(start)
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def serve_media(request, path):
+    # Каталог проверяется после нормализации, иначе posts/../ открыл бы
+    # весь MEDIA_ROOT
+    path = posixpath.normpath(path).lstrip('/')
+    if not path.startswith(tuple(settings.MEDIA_PUBLIC_DIRS)):
+        raise Http404
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+    stat = os.stat(full_path)
+    etag = file_etag(stat)
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None:
+        response = file_response(request, path, full_path, stat, etag)
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['Cache-Control'] = 'public, max-age={}'.format(
+        settings.MEDIA_CACHE_MAX_AGE)
+    return response
+
+
+def file_response(request, path, full_path, stat, etag):
+    content_type = (mimetypes.guess_type(full_path)[0]
+                    or 'application/octet-stream')
+    sendfile = settings.MEDIA_SENDFILE
+    if sendfile == 'x-accel-redirect':
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_PREFIX + path
+        return response
+    if sendfile == 'x-sendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = full_path
+        return response
+
+    size = stat.st_size
+    byte_range = None
+    if request.META.get('HTTP_IF_RANGE', etag) == etag:
+        byte_range = parse_range(request.META.get('HTTP_RANGE'), size)
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = 'bytes */{}'.format(size)
+        return response
+    if byte_range is None:
+        response = FileResponse(open(full_path, 'rb'),
+                                content_type=content_type)
+    else:
+        start, end = byte_range
+        response = FileResponse(
+            RangeFile(full_path, start, end - start + 1),
+            status=206, content_type=content_type)
+        response['Content-Range'] = 'bytes {}-{}/{}'.format(start, end, size)
+        response['Content-Length'] = end - start + 1
+    response['Accept-Ranges'] = 'bytes'
+    return response
@@ -0,0 +1,231 @@
+"""Метрики представлений в формате Prometheus.
+
+MetricsMiddleware для каждого имени маршрута считает гистограмму времени
+ответа, число SQL-запросов и их суммарное время. Счетчики копятся в
+памяти процесса и не реже раза в METRICS_FLUSH_INTERVAL секунд
+записываются в кеш METRICS_CACHE под ключом своего воркера. Страница
+/metrics/ складывает снимки всех воркеров, поэтому при нескольких
+процессах gunicorn счетчики не теряются и не зависят от того, какой
+воркер ответил на запрос Prometheus.
+
+METRICS_CACHE - отдельная таблица без вытеснения. Если бы снимок
+вытеснили записи страниц, сумма уменьшилась бы, и Prometheus принял бы
+это за сброс счетчика.
+
+Страница доступна персоналу сайта или по заголовку
+Authorization: Bearer <METRICS_TOKEN>.
+"""
+import os
+import socket
+import threading
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+WORKERS_KEY = 'metrics:workers'
+WORKER_KEY = 'metrics:worker:{}'
+# Снимок умершего воркера пропадает из суммы через сутки
+WORKER_TIMEOUT = 60 * 60 * 24
+
+_views = {}
+_lock = threading.Lock()
+_flushed_at = [0]
+
+
+def _worker_id():
+    return '{}:{}'.format(socket.gethostname(), os.getpid())
+
+
+def _shared():
+    # Без отдельного кеша метрик счетчики выгружаются в кеш по умолчанию
+    alias = settings.METRICS_CACHE
+    return caches[alias if alias in settings.CACHES else 'default']
+
+
+def _empty():
+    return {'buckets': [0] * (len(LATENCY_BUCKETS) + 1), 'count': 0,
+            'sum': 0.0, 'queries': 0, 'sql_time': 0.0,
+            'response_bytes': 0, 'sent_bytes': 0, 'throttled': 0}
+
+
+def view_name(request):
+    match = request.resolver_match
+    return match.view_name if match and match.view_name else 'unresolved'
+
+
+def record(view, duration, queries, sql_time):
+    with _lock:
+        metrics = _views.setdefault(view, _empty())
+        bucket = len(LATENCY_BUCKETS)
+        for number, bound in enumerate(LATENCY_BUCKETS):
+            if duration <= bound:
+                bucket = number
+                break
+        metrics['buckets'][bucket] += 1
+        metrics['count'] += 1
+        metrics['sum'] += duration
+        metrics['queries'] += queries
+        metrics['sql_time'] += sql_time
+
+
+def record_size(view, response_bytes, sent_bytes):
+    '''Размер тела ответа до сжатия и отправленный клиенту'''
+    with _lock:
+        metrics = _views.setdefault(view, _empty())
+        metrics['response_bytes'] += response_bytes
+        metrics['sent_bytes'] += sent_bytes
+
+
+def record_throttled(view):
+    '''Запрос отклонен ограничением частоты'''
+    with _lock:
+        _views.setdefault(view, _empty())['throttled'] += 1
+
+
+def flush(force=False):
+    '''Записывает снимок счетчиков процесса в кеш метрик'''
+    now = time.monotonic()
+    with _lock:
+        interval = settings.METRICS_FLUSH_INTERVAL
+        if not force and now - _flushed_at[0] < interval:
+            return
+        _flushed_at[0] = now
+        snapshot = {view: dict(metrics, buckets=list(metrics['buckets']))
+                    for view, metrics in _views.items()}
+    shared = _shared()
+    worker = _worker_id()
+    shared.set(WORKER_KEY.format(worker), snapshot, WORKER_TIMEOUT)
+    # Запись списка воркеров может потеряться при гонке, но каждый
+    # воркер добавляет себя заново при следующей выгрузке
+    workers = shared.get(WORKERS_KEY, set())
+    if worker not in workers:
+        shared.set(WORKERS_KEY, workers | {worker}, None)
+
+
+def collect():
+    '''Сумма снимков всех живых воркеров'''
+    flush(force=True)
+    shared = _shared()
+    workers = shared.get(WORKERS_KEY, set())
+    snapshots = shared.get_many(
+        [WORKER_KEY.format(worker) for worker in workers])
+    if len(snapshots) < len(workers):
+        shared.set(WORKERS_KEY, {worker for worker in workers
+                                 if WORKER_KEY.format(worker) in snapshots},
+                   None)
+    total = {}
+    for snapshot in snapshots.values():
+        for view, metrics in snapshot.items():
+            summed = total.setdefault(view, _empty())
+            summed['buckets'] = [a + b for a, b in zip(summed['buckets'],
+                                                       metrics['buckets'])]
+            for name in ('count', 'sum', 'queries', 'sql_time',
+                         'response_bytes', 'sent_bytes', 'throttled'):
+                summed[name] += metrics.get(name, 0)
+    return total
+
+
+def render(total):
+    '''Текстовый формат Prometheus'''
+    lines = [
+        '# HELP yatube_request_duration_seconds Время ответа представления',
+        '# TYPE yatube_request_duration_seconds histogram',
+    ]
+    for view, metrics in sorted(total.items()):
+        cumulative = 0
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ['+Inf']
+        for bound, count in zip(bounds, metrics['buckets']):
+            cumulative += count
+            lines.append('yatube_request_duration_seconds_bucket'
+                         '{{view="{}",le="{}"}} {}'.format(
+                             view, bound, cumulative))
+        lines.append('yatube_request_duration_seconds_sum{{view="{}"}} {}'
+                     .format(view, metrics['sum']))
+        lines.append('yatube_request_duration_seconds_count{{view="{}"}} {}'
+                     .format(view, metrics['count']))
+    lines += [
+        '# HELP yatube_sql_queries_total Число SQL-запросов представления',
+        '# TYPE yatube_sql_queries_total counter',
+    ]
+    lines += ['yatube_sql_queries_total{{view="{}"}} {}'.format(
+        view, metrics['queries']) for view, metrics in sorted(total.items())]
+    lines += [
+        '# HELP yatube_sql_duration_seconds_total Время SQL-запросов '
+        'представления',
+        '# TYPE yatube_sql_duration_seconds_total counter',
+    ]
+    lines += ['yatube_sql_duration_seconds_total{{view="{}"}} {}'.format(
+        view, metrics['sql_time']) for view, metrics in sorted(total.items())]
+    lines += [
+        '# HELP yatube_response_bytes_total Размер ответов до сжатия',
+        '# TYPE yatube_response_bytes_total counter',
+    ]
+    lines += ['yatube_response_bytes_total{{view="{}"}} {}'.format(
+        view, metrics['response_bytes'])
+        for view, metrics in sorted(total.items())]
+    lines += [
+        '# HELP yatube_response_sent_bytes_total Размер ответов, '
+        'отправленных клиенту',
+        '# TYPE yatube_response_sent_bytes_total counter',
+    ]
+    lines += ['yatube_response_sent_bytes_total{{view="{}"}} {}'.format(
+        view, metrics['sent_bytes'])
+        for view, metrics in sorted(total.items())]
+    lines += [
+        '# HELP yatube_throttled_requests_total Запросы, отклоненные '
+        'ограничением частоты',
+        '# TYPE yatube_throttled_requests_total counter',
+    ]
+    lines += ['yatube_throttled_requests_total{{view="{}"}} {}'.format(
+        view, metrics['throttled']) for view, metrics in sorted(total.items())]
+    return '\n'.join(lines) + '\n'
+
+
+class QueryTimer:
+    '''Обертка выполнения SQL, считающая запросы и их время'''
+    def __init__(self):
+        self.queries = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.queries += 1
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timer = QueryTimer()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+        record(view_name(request), duration, timer.queries, timer.duration)
+        flush()
+        return response
+
+
+def metrics_view(request):
+    '''Страница метрик для Prometheus'''
+    token = settings.METRICS_TOKEN
+    header = request.META.get('HTTP_AUTHORIZATION', '')
+    authorized = bool(token) and constant_time_compare(
+        header, 'Bearer {}'.format(token))
+    if not authorized and not request.user.is_staff:
+        return HttpResponseForbidden()
+    return HttpResponse(render(collect()),
+                        content_type='text/plain; version=0.0.4')
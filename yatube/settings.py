@@ -65,11 +65,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'yatube.metrics.MetricsMiddleware',
+    'yatube.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'yatube.db.ReplicaMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'yatube.throttle.ThrottleMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     "debug_toolbar.middleware.DebugToolbarMiddleware",
@@ -105,6 +109,27 @@ DATABASES = {
     'default': env.db()
 }
 
+# Потоки gunicorn держат соединения с базой открытыми между запросами
+
+DATABASES['default']['CONN_MAX_AGE'] = env.int('CONN_MAX_AGE', default=60)
+
+# Реплики только для чтения, через запятую в REPLICA_DATABASE_URLS.
+# В тестах реплики указывают на тестовую основную базу
+
+REPLICA_DATABASES = []
+for number, url in enumerate(env.list('REPLICA_DATABASE_URLS', default=[])):
+    alias = 'replica_{}'.format(number)
+    DATABASES[alias] = env.db_url_config(url)
+    DATABASES[alias]['CONN_MAX_AGE'] = DATABASES['default']['CONN_MAX_AGE']
+    DATABASES[alias]['TEST'] = {'MIRROR': 'default'}
+    REPLICA_DATABASES.append(alias)
+
+DATABASE_ROUTERS = ['yatube.db.ReplicaRouter']
+
+# Сколько секунд после записи пользователь читает основную базу
+
+REPLICA_STICKY_SECONDS = 5
+
 
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
@@ -144,11 +169,29 @@ USE_TZ = True
 
 STATIC_URL = "/static/"
 
-STATIC_ROOT = os.path.join(BASE_DIR, "static")
+# Статика проекта лежит в posts/static, collectstatic собирает ее
+# вместе со статикой admin и debug_toolbar из установленных пакетов в
+# STATIC_ROOT: имена с хешем содержимого и сжатые копии .gz/.br.
+# SERVE_STATIC включает раздачу STATIC_ROOT самим Django
+# (yatube.static), если перед ним нет nginx
+
+STATIC_ROOT = env('STATIC_ROOT',
+                  default=os.path.join(BASE_DIR, "staticfiles"))
+STATICFILES_STORAGE = 'yatube.storage.CompressedManifestStaticFilesStorage'
+SERVE_STATIC = env.bool('SERVE_STATIC', default=False)
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Раздача MEDIA_ROOT через yatube.media: открытые каталоги, передача
+# файла прокси ('x-accel-redirect' для nginx, 'x-sendfile' для Apache
+# и lighttpd, пусто - отдает Django) и internal-location nginx
+
+MEDIA_PUBLIC_DIRS = ("posts/", "cache/")
+MEDIA_SENDFILE = env('MEDIA_SENDFILE', default='')
+MEDIA_ACCEL_PREFIX = "/internal-media/"
+MEDIA_CACHE_MAX_AGE = 60 * 60 * 24
+
 # Login
 
 LOGIN_URL = "/auth/login/"
@@ -160,11 +203,105 @@ EMAIL_FILE_PATH = os.path.join(BASE_DIR, "sent_emails")
 
 SITE_ID = 1
 
+# Загружаемые изображения публикаций: предельный размер файла,
+# большая сторона и качество JPEG после нормализации
+
+POST_IMAGE_MAX_SIZE = 10 * 1024 * 1024
+POST_IMAGE_MAX_SIDE = 1920
+POST_IMAGE_QUALITY = 85
+
+# Миниатюры создаются в фоне после сохранения публикации, шаблоны
+# только ищут готовые (см. posts.thumbnails)
+
+THUMBNAIL_BACKEND = 'posts.thumbnails.PostThumbnailBackend'
+
+# Кеш в памяти воркера перед общим кешем в таблице базы данных.
+# Таблица создается командой `python manage.py createcachetable`.
+# Страницы и фрагменты лент и карточек кешируются под ключами с версией
+# данных, их запись не требует рассылки инвалидаций другим воркерам.
+# Общий кеш при переполнении удаляет десятую часть записей
+
 CACHES = {
         'default': {
-            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        }
+            'BACKEND': 'yatube.cache.TwoTierCache',
+            'OPTIONS': {
+                'SHARED': 'shared',
+                'MAX_ENTRIES': 1000,
+                'LOCAL_TIMEOUT': 5,
+                'SYNC_INTERVAL': 0.5,
+                'IMMUTABLE_PREFIXES': ('anonymous_page:',
+                                       'template.cache.feed_page.',
+                                       'template.cache.post_card.'),
+            },
+        },
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'yatube_cache',
+            'OPTIONS': {
+                'MAX_ENTRIES': 100000,
+                'CULL_FREQUENCY': 10,
+            },
+        },
+        # Снимки метрик воркеров: отдельная маленькая таблица, из которой
+        # записи не вытесняются записями страниц и фрагментов
+        'metrics': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'yatube_metrics',
+            'OPTIONS': {'MAX_ENTRIES': 10 ** 9},
+        },
+}
+
+# Лента подписок: публикации авторов, у которых подписчиков не больше
+# TIMELINE_FANOUT_LIMIT, записываются в ленты подписчиков при публикации,
+# остальные добавляются к ленте при чтении
+
+TIMELINE_FANOUT_LIMIT = 10000
+TIMELINE_BACKFILL_LIMIT = 1000
+
+# Сколько секунд обратный прокси может отдавать страницу для
+# неавторизованных посетителей без перепроверки по ETag
+
+PAGE_CACHE_MAX_AGE = 10
+
+# Ленты (главная, группа, профиль, подписки) отдаются авторизованным
+# пользователям потоком: шапка страницы уходит сразу, карточки
+# публикаций - по мере отрисовки
+
+STREAM_FEEDS = env.bool('STREAM_FEEDS', default=False)
+
+# Конфигурация полнотекстового поиска PostgreSQL (to_tsvector)
+
+SEARCH_CONFIG = 'russian'
+
+# Метрики представлений на /metrics/: кеш, в который воркеры выгружают
+# счетчики, интервал выгрузки в секундах и токен Prometheus
+
+METRICS_CACHE = 'metrics'
+METRICS_FLUSH_INTERVAL = 10
+METRICS_TOKEN = env('METRICS_TOKEN', default='')
+
+# Ограничение частоты записи: имя маршрута - (сколько запросов можно
+# сделать подряд, за сколько секунд лимит восстанавливается). Маршруты
+# из THROTTLE_GET_ROUTES меняют данные и при GET.
+#
+# THROTTLE_IP_HEADER - откуда брать адрес неавторизованного клиента.
+# По умолчанию REMOTE_ADDR, но за nginx это адрес самого nginx: все
+# анонимные регистрации попадут в одну корзину на весь сайт, 5 в час.
+# За прокси укажите HTTP_X_REAL_IP (proxy_set_header X-Real-IP
+# $remote_addr) или HTTP_X_FORWARDED_FOR. Из X-Forwarded-For берется
+# последний адрес, его дописал прокси, остальные мог подставить клиент
+
+THROTTLE_RATES = {
+    'new_post': (10, 600),
+    'add_comment': (20, 600),
+    'add_group': (3, 3600),
+    'profile_follow': (30, 600),
+    'profile_unfollow': (30, 600),
+    'signup': (5, 3600),
 }
+THROTTLE_GET_ROUTES = ('profile_follow', 'profile_unfollow')
+THROTTLE_CACHE = 'shared'
+THROTTLE_IP_HEADER = env('THROTTLE_IP_HEADER', default='REMOTE_ADDR')
 
 INTERNAL_IPS = [
         "127.0.0.1",
@@ -0,0 +1,68 @@
+r"""Раздача собранной статики без отдельного веб-сервера (SERVE_STATIC).
+
+Клиенту, который принимает br или gzip, отдается заранее сжатая копия
+из collectstatic. Файлы с хешем содержимого в имени кешируются навсегда
+(immutable), остальные перепроверяются по Last-Modified. За nginx те
+же правила задаются так:
+
+    location /static/ {
+        gzip_static on;
+        brotli_static on;
+        location ~ "\.[0-9a-f]{12}\.\w+$" {
+            add_header Cache-Control "public, max-age=31536000, immutable";
+        }
+    }
+"""
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+HASHED_NAME = re.compile(r'\.[0-9a-f]{12}\.\w+$')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def accepted_encodings(request):
+    header = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    return {part.split(';')[0].strip() for part in header.split(',')}
+
+
+def serve_static(request, path):
+    try:
+        full_path = safe_join(settings.STATIC_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+    stat = os.stat(full_path)
+    if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'),
+                              stat.st_mtime, stat.st_size):
+        return HttpResponseNotModified()
+    content_type = mimetypes.guess_type(full_path)[0]
+    encoding = None
+    accepted = accepted_encodings(request)
+    for name, suffix in ENCODINGS:
+        if name in accepted and os.path.isfile(full_path + suffix):
+            encoding = name
+            full_path += suffix
+            break
+    response = FileResponse(open(full_path, 'rb'),
+                            content_type=content_type or
+                            'application/octet-stream')
+    if encoding:
+        response['Content-Encoding'] = encoding
+    patch_vary_headers(response, ('Accept-Encoding',))
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    if HASHED_NAME.search(path):
+        response['Cache-Control'] = IMMUTABLE
+    else:
+        response['Cache-Control'] = 'no-cache'
+    return response
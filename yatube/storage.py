@@ -0,0 +1,59 @@
+"""Хранилище статики для collectstatic: имена файлов с хешем
+содержимого и заранее сжатые копии рядом с ними (.gz и, если
+установлен пакет brotli, .br). Прокси или yatube.static отдают сжатую
+копию без сжатия на лету, а имена с хешем можно кешировать навсегда.
+"""
+import gzip
+import io
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.map', '.svg', '.txt', '.html',
+                           '.json', '.xml', '.eot', '.ttf', '.otf')
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    def stored_name(self, name):
+        # Пока collectstatic не запускали (разработка, тесты), манифеста
+        # нет, и шаблоны получают исходные имена
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    def post_process(self, paths, dry_run=False, **options):
+        hashed_names = set()
+        for name, hashed_name, processed in super().post_process(
+                paths, dry_run, **options):
+            if hashed_name:
+                hashed_names.add(hashed_name)
+            yield name, hashed_name, processed
+        if dry_run:
+            return
+        for hashed_name in sorted(hashed_names):
+            if hashed_name.endswith(COMPRESSIBLE_EXTENSIONS):
+                self.compress(hashed_name)
+
+    def compress(self, name):
+        '''Сохраняет сжатые копии файла, если они меньше исходного'''
+        with self.open(name) as original:
+            content = original.read()
+        buffer = io.BytesIO()
+        # mtime=0: сжатая копия одинакова при каждом collectstatic
+        with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=9,
+                           mtime=0) as gzipped:
+            gzipped.write(content)
+        compressed = {'.gz': buffer.getvalue()}
+        if brotli is not None:
+            compressed['.br'] = brotli.compress(content)
+        for suffix, data in compressed.items():
+            if len(data) >= len(content):
+                continue
+            if self.exists(name + suffix):
+                self.delete(name + suffix)
+            self._save(name + suffix, ContentFile(data))
@@ -0,0 +1,79 @@
+"""Ограничение частоты запросов к маршрутам, которые пишут в базу.
+
+Для каждого маршрута из THROTTLE_RATES задается корзина маркеров:
+сколько запросов можно сделать подряд и за сколько секунд корзина
+наполняется снова. Корзина своя у каждого пользователя, а у
+неавторизованных посетителей - у каждого IP-адреса. Сверх лимита
+ответ 429 с заголовком Retry-After, отказы видны в /metrics/.
+
+Корзина хранится в кеше THROTTLE_CACHE одним числом - временем, когда
+она снова станет полной (алгоритм GCRA). Чтение и запись не атомарны,
+поэтому при одновременных запросах лимит может быть превышен на
+несколько запросов, этого достаточно, чтобы остановить поток записи.
+"""
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.shortcuts import render
+
+from . import metrics
+
+BUCKET_KEY = 'throttle:{}:{}'
+WRITE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+
+def _cache():
+    alias = settings.THROTTLE_CACHE
+    return caches[alias if alias in settings.CACHES else 'default']
+
+
+def client_key(request):
+    '''Пользователь или, для неавторизованных, IP-адрес'''
+    if request.user.is_authenticated:
+        return 'user:{}'.format(request.user.pk)
+    address = request.META.get(settings.THROTTLE_IP_HEADER, '')
+    # В X-Forwarded-For клиент может прислать любые адреса, прокси
+    # дописывает настоящий в конец
+    return 'ip:{}'.format(address.split(',')[-1].strip())
+
+
+def take_token(key, capacity, period):
+    '''Забирает маркер из корзины. Возвращает 0 или число секунд, через
+    которое маркер появится'''
+    interval = period / capacity
+    now = time.time()
+    cache = _cache()
+    full_at = max(cache.get(key, now), now)
+    wait = full_at + interval - now - period
+    if wait > 0:
+        return math.ceil(wait)
+    cache.set(key, full_at + interval, math.ceil(period))
+    return 0
+
+
+class ThrottleMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        name = request.resolver_match.url_name
+        rate = settings.THROTTLE_RATES.get(name)
+        if rate is None:
+            return None
+        if (request.method not in WRITE_METHODS
+                and name not in settings.THROTTLE_GET_ROUTES):
+            return None
+        retry_after = take_token(BUCKET_KEY.format(name, client_key(request)),
+                                 *rate)
+        if not retry_after:
+            return None
+        metrics.record_throttled(metrics.view_name(request))
+        response = render(request, 'misc/429.html',
+                          {'retry_after': retry_after}, status=429)
+        response['Retry-After'] = str(retry_after)
+        return response
@@ -15,10 +15,13 @@ Including another URLconf
 """
 from django.conf import settings
 from django.conf.urls import handler404, handler500
-from django.conf.urls.static import static
 from django.contrib import admin
 from django.contrib.flatpages import views
-from django.urls import include, path
+from django.urls import include, path, re_path
+
+from .media import serve_media
+from .metrics import metrics_view
+from .static import serve_static
 
 handler404 = "posts.views.page_not_found"
 handler500 = "posts.views.server_error"
@@ -28,6 +31,9 @@ urlpatterns = [
     path("auth/", include("users.urls")),
     path("auth/", include("django.contrib.auth.urls")),
     path("admin/", admin.site.urls),
+    path("metrics/", metrics_view, name="metrics"),
+    re_path(r"^{}(?P<path>.+)$".format(settings.MEDIA_URL.lstrip("/")),
+            serve_media, name="media"),
     path('about-us/', views.flatpage, {'url': '/about-us/'}, name='about'),
     path('terms/', views.flatpage, {'url': '/terms/'}, name='terms'),
     path('about-author/', views.flatpage, {'url': '/about-author/'},
@@ -37,10 +43,11 @@ urlpatterns = [
     path("", include("posts.urls")),
 ]
 
+if settings.SERVE_STATIC:
+    urlpatterns.insert(0, re_path(
+        r"^{}(?P<path>.+)$".format(settings.STATIC_URL.lstrip("/")),
+        serve_static))
+
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL,
-                          document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL,
-                          document_root=settings.STATIC_ROOT)
     import debug_toolbar
     urlpatterns += (path("__debug__/", include(debug_toolbar.urls)),)